@@ -0,0 +1,111 @@
+"""Local stand-in for Meetup's announce API, for testing the HTTP announce backend offline.
+
+Start the stub, then point the announcer at it:
+
+    python announce_stub_server.py --port 8765
+    python meetup_announcer.py --group-url "https://www.meetup.com/joyful-parenting-sf/" \
+        --announce-backend http --announce-endpoint http://127.0.0.1:8765/gql2
+
+Use --fail to make every announce return a 200 that doesn't confirm it. The
+announcer can't tell whether that announce went through, so it reloads the
+event page and marks the event failed without trying the UI. Use --refuse to
+answer every announce with a 403 instead, which the announcer knows never ran,
+so it falls back to clicking through the UI.
+"""
+import json
+import logging
+import argparse
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+
+class AnnounceStubHandler(BaseHTTPRequestHandler):
+    """Answers announceEvent mutations the way the real endpoint does."""
+
+    fail = False
+    refuse = False
+    announced_events = set()
+
+    def send_json(self, status, body):
+        data = json.dumps(body).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_POST(self):
+        if self.path.rstrip('/') != '/gql2':
+            self.send_json(404, {'errors': [{'message': f'Unknown path {self.path}'}]})
+            return
+
+        if not self.headers.get('Cookie'):
+            self.send_json(401, {'errors': [{'message': 'Not logged in'}]})
+            return
+
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+            payload = json.loads(self.rfile.read(length) or b'{}')
+        except ValueError:
+            self.send_json(400, {'errors': [{'message': 'Invalid JSON'}]})
+            return
+
+        if payload.get('operationName') != 'announceEvent':
+            self.send_json(400, {'errors': [{'message': f"Unsupported operation {payload.get('operationName')}"}]})
+            return
+
+        event_id = ((payload.get('variables') or {}).get('input') or {}).get('eventId')
+        if not event_id:
+            self.send_json(200, {'data': {'announceEvent': {
+                'event': None,
+                'errors': [{'code': 'INVALID_INPUT', 'message': 'eventId is required'}]
+            }}})
+            return
+
+        if self.refuse:
+            logging.info(f"Refusing announce for event {event_id} (--refuse)")
+            self.send_json(403, {'errors': [{'message': 'Announce refused by stub'}]})
+            return
+
+        if self.fail:
+            logging.info(f"Rejecting announce for event {event_id} (--fail)")
+            self.send_json(200, {'data': {'announceEvent': {
+                'event': {'id': event_id, 'isAnnounced': False},
+                'errors': [{'code': 'STUB_FAILURE', 'message': 'Announce rejected by stub'}]
+            }}})
+            return
+
+        if not self.headers.get('X-CSRF-Token'):
+            logging.warning(f"Announce for event {event_id} arrived without a CSRF token")
+
+        self.announced_events.add(event_id)
+        logging.info(f"Announced event {event_id} ({len(self.announced_events)} announced so far)")
+        self.send_json(200, {'data': {'announceEvent': {
+            'event': {'id': event_id, 'isAnnounced': True},
+            'errors': []
+        }}})
+
+    def log_message(self, format, *args):
+        logging.info(format % args)
+
+def main():
+    parser = argparse.ArgumentParser(description='Local stub for the Meetup announce API')
+    parser.add_argument('--host', default='127.0.0.1', help='Address to listen on')
+    parser.add_argument('--port', type=int, default=8765, help='Port to listen on')
+    parser.add_argument('--fail', action='store_true', help='Answer every announce with an unconfirmed 200')
+    parser.add_argument('--refuse', action='store_true', help='Refuse every announce with a 403')
+    args = parser.parse_args()
+
+    AnnounceStubHandler.fail = args.fail
+    AnnounceStubHandler.refuse = args.refuse
+    server = ThreadingHTTPServer((args.host, args.port), AnnounceStubHandler)
+    logging.info(f"Announce stub listening on http://{args.host}:{args.port}/gql2")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+if __name__ == "__main__":
+    main()
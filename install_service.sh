@@ -3,6 +3,8 @@
 # Copy service and timer files to systemd directory
 sudo cp meetup-announcer.service /etc/systemd/system/
 sudo cp meetup-announcer.timer /etc/systemd/system/
+# Watch mode is an alternative to the timer; enable it with: sudo systemctl enable --now meetup-announcer-watch.service
+sudo cp meetup-announcer-watch.service /etc/systemd/system/
 
 # Reload systemd to recognize new files
 sudo systemctl daemon-reload
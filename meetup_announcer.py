@@ -2,9 +2,22 @@ import os
 import time
 import logging
 import argparse
+import base64
 import smtplib
 import traceback
 import re
+import json
+import hashlib
+import shutil
+import signal
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+from collections import namedtuple, deque
+from urllib.parse import urlsplit
+from contextlib import contextmanager
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
 from email.mime.image import MIMEImage
@@ -15,23 +28,70 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException, StaleElementReferenceException
 from pyvirtualdisplay import Display
 from selenium.webdriver.chrome.options import Options
-from constants import GMAIL_ADDRESS, GMAIL_PASSWORD
 from datetime import datetime, timedelta
 from dateutil import parser as date_parser
 import pytz
-# Set up logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler('meetup_announcer.log', mode='w'),  # 'w' mode overwrites the file
-        logging.StreamHandler()
-    ]
-)
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import NewConnectionError
+from page_archive import PageRecorder, PageArchive, ReplayServer
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_PROFILE_PATH = os.path.join(BASE_DIR, 'chrome_profile')
+DEFAULT_DEBUGGING_PORT = 9222
+# Set by --record; pages are snapshotted into it as they are visited
+page_recorder = None
+# Turned off for offline replays so they never send mail
+email_notifications_enabled = True
+# Turned off for offline replays, where scripts are blocked and no announce request can ever be sent
+network_confirmation_enabled = True
+# Every page load and API call waits on this; replaced in main() from the command line
+request_governor = None
+# Set by --deadline; every wait and sleep is capped by what's left of the current phase
+run_deadline = None
+# Ring buffer of CDP Network/Page events for the current event page; off with --network-capture-size 0
+network_recorder = None
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+
+def configure_logging():
+    """Log to the console. Done by main() so importing the module has no side effects."""
+    logging.basicConfig(level=logging.INFO, format=LOG_FORMAT, handlers=[logging.StreamHandler()])
+
+# Set in --worker mode so workers sharing a working directory write their own log and screenshots
+run_file_suffix = ''
+
+def run_file(name):
+    """This process's name for a log or screenshot file, e.g. meetup_announcer.<worker>.log for a worker."""
+    if not run_file_suffix:
+        return name
+    base, extension = os.path.splitext(name)
+    return f"{base}.{run_file_suffix}{extension}"
+
+def start_log_file():
+    """Also log to meetup_announcer.log (per worker in --worker mode), replacing the last run's log.
+
+    Only called once a run has work to do, so hourly wake-ups that find
+    nothing due keep the log of the last real run for error emails.
+    """
+    root = logging.getLogger()
+    if any(isinstance(handler, logging.FileHandler) for handler in root.handlers):
+        return
+    file_handler = logging.FileHandler(run_file('meetup_announcer.log'), mode='w')  # 'w' mode overwrites the file
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    root.addHandler(file_handler)
+
+def send_error_email(error_message, log_file_path, screenshot_path, extra_attachments=None):
+    """Send error notification email with log contents, screenshot and any extra files."""
+    if not email_notifications_enabled:
+        logging.info(f"Email notifications disabled - not sending: {error_message[:200]}")
+        return
 
-def send_error_email(error_message, log_file_path, screenshot_path):
-    """Send error notification email with log contents and screenshot."""
     try:
+        # Only needed to send mail, so the module can be imported without them
+        from constants import GMAIL_ADDRESS, GMAIL_PASSWORD
+
         logging.info("Attempting to send error notification email...")
         
         # Create message
@@ -87,7 +147,7 @@ def send_error_email(error_message, log_file_path, screenshot_path):
                 logging.warning("No logs available to attach")
         
         # Attach screenshot if it exists
-        if os.path.exists(screenshot_path):
+        if screenshot_path and os.path.exists(screenshot_path):
             logging.info(f"Attaching screenshot: {screenshot_path}")
             with open(screenshot_path, 'rb') as f:
                 img_data = f.read()
@@ -97,6 +157,15 @@ def send_error_email(error_message, log_file_path, screenshot_path):
         else:
             logging.info(f"Screenshot not found: {screenshot_path}")
         
+        # Attach extra files (e.g. network captures of failed events)
+        for attachment_path in extra_attachments or []:
+            if os.path.exists(attachment_path):
+                logging.info(f"Attaching {attachment_path}")
+                with open(attachment_path, 'r') as f:
+                    attachment = MIMEText(f.read())
+                attachment.add_header('Content-Disposition', 'attachment', filename=os.path.basename(attachment_path))
+                msg.attach(attachment)
+        
         # Send email using Gmail SMTP
         logging.info("Connecting to Gmail SMTP server...")
         with smtplib.SMTP_SSL('smtp.gmail.com', 465) as server:
@@ -114,6 +183,462 @@ def send_error_email(error_message, log_file_path, screenshot_path):
         logging.error(error_msg)
         print(f"FAILED TO SEND EMAIL: {str(e)}")  # Also print to console
 
+def sd_notify(*lines):
+    """Send a notification to systemd. Does nothing when not started by systemd with NOTIFY_SOCKET."""
+    address = os.environ.get('NOTIFY_SOCKET')
+    if not address:
+        return False
+    if address.startswith('@'):
+        # Abstract namespace socket
+        address = '\0' + address[1:]
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sock:
+            sock.connect(address)
+            sock.sendall('\n'.join(lines).encode('utf-8'))
+        return True
+    except OSError as e:
+        logging.debug(f"Could not notify systemd: {e}")
+        return False
+
+last_watchdog_ping = 0.0
+
+# The WorkLease a --worker holds on the group it is announcing
+work_lease = None
+
+def sd_watchdog_ping(status=None):
+    """Tell systemd's watchdog we are still making progress, optionally updating the status line.
+
+    Called from every loop that waits on the browser, so a hung WebDriver call
+    stops the pings and systemd kills and restarts the service. The same
+    progress points keep a worker's lease on its group alive.
+    """
+    global last_watchdog_ping
+    if work_lease:
+        work_lease.renew()
+    now = time.monotonic()
+    if status is None and now - last_watchdog_ping < 1:
+        return
+    last_watchdog_ping = now
+    if status:
+        sd_notify('WATCHDOG=1', f'STATUS={status}')
+    else:
+        sd_notify('WATCHDOG=1')
+
+class DeadlineExceeded(Exception):
+    """Raised when the run's time budget runs out before a step could finish."""
+
+class RunDeadline:
+    """Whole-run time budget, split into per-phase budgets.
+
+    Authentication and listing each get a fixed share of the total for every
+    group; event processing gets whatever is left. Inside a phase, waits are
+    capped by whichever ends first, the phase budget or the whole run.
+    """
+
+    PHASE_SHARES = {'auth': 0.2, 'listing': 0.2}
+
+    def __init__(self, seconds):
+        self.total = seconds
+        self.expires_at = time.monotonic() + seconds
+        self.phase_name = None
+        self.phase_expires_at = self.expires_at
+        self.spent = {}
+
+    def start_group(self):
+        """Give the next group fresh auth and listing budgets."""
+        self.spent = {}
+
+    def remaining_total(self):
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def remaining(self):
+        """Time left in the current phase (or the whole run outside a phase)."""
+        return max(0.0, min(self.phase_expires_at, self.expires_at) - time.monotonic())
+
+    def expired(self):
+        return self.remaining_total() <= 0
+
+    @contextmanager
+    def phase(self, name, seconds=None):
+        if seconds is None:
+            share = self.PHASE_SHARES.get(name)
+            seconds = self.total * share - self.spent.get(name, 0) if share else self.remaining_total()
+        previous = (self.phase_name, self.phase_expires_at)
+        started = time.monotonic()
+        self.phase_name = name
+        self.phase_expires_at = min(self.expires_at, started + max(0.0, seconds))
+        try:
+            yield
+        finally:
+            self.spent[name] = self.spent.get(name, 0) + time.monotonic() - started
+            self.phase_name, self.phase_expires_at = previous
+
+@contextmanager
+def deadline_phase(name, seconds=None):
+    """Enter a budgeted phase of the run deadline, if there is one."""
+    if run_deadline is None:
+        yield
+        return
+    with run_deadline.phase(name, seconds):
+        yield
+
+def wait_timeout(seconds):
+    """Cap a wait so it doesn't run past the current phase budget."""
+    if run_deadline is None:
+        return seconds
+    return min(seconds, run_deadline.remaining())
+
+def deadline_sleep(seconds):
+    time.sleep(wait_timeout(seconds))
+
+def out_of_time():
+    return run_deadline is not None and run_deadline.remaining() <= 0
+
+def raise_if_out_of_time(step):
+    """Raise DeadlineExceeded if the current phase has no time left, so a timed-out step isn't misreported."""
+    if out_of_time():
+        raise DeadlineExceeded(f"Ran out of time during {step} (phase '{run_deadline.phase_name}', "
+                               f"{run_deadline.remaining_total():.0f}s left of the {run_deadline.total:.0f}s run deadline)")
+
+def apply_deadline_to_driver(driver):
+    """Keep the driver's implicit wait and page load timeout within the remaining budget."""
+    if run_deadline is None:
+        return
+    try:
+        driver.implicitly_wait(min(30, run_deadline.remaining()))
+        driver.set_page_load_timeout(max(1, min(60, run_deadline.remaining())))
+    except Exception as e:
+        logging.debug(f"Could not apply deadline to driver timeouts: {e}")
+
+def drain_performance_log(driver):
+    """Read Chrome's performance log and return its CDP Network/Page messages as raw JSON strings.
+
+    Chrome hands out each log entry only once, so everything that reads the log
+    goes through here and the network recorder gets a copy of every message.
+    Returns None if the driver has no performance log.
+    """
+    try:
+        entries = driver.get_log('performance')
+    except Exception as e:
+        logging.debug(f"Could not read performance log: {e}")
+        return None
+    # Cheap substring check so we never parse messages we don't keep
+    messages = [entry.get('message', '') for entry in entries]
+    messages = [message for message in messages if '"Network.' in message or '"Page.' in message]
+    if network_recorder:
+        network_recorder.buffer.extend(messages)
+    return messages
+
+class NetworkRecorder:
+    """Bounded buffer of the CDP Network and Page events seen on one event page.
+
+    Chrome's performance log is drained before and after each event page; the
+    raw messages go into a fixed-size ring buffer and are only parsed when the
+    event failed or was slow, in which case they are written out as a HAR-like
+    JSON file. Normal runs just drain and drop the log.
+    """
+
+    def __init__(self, size=1000, slow_seconds=30):
+        self.buffer = deque(maxlen=size)
+        self.slow_seconds = slow_seconds
+        self.started = None
+        self.dumped = []
+
+    def start(self, driver):
+        """Drop everything logged so far and start capturing for a new page."""
+        drain_performance_log(driver)
+        self.buffer.clear()
+        self.started = time.monotonic()
+
+    def finish(self, driver, label, failed):
+        """Stop capturing; dump the buffer if the page failed or was slow. Returns the dump path or None."""
+        drain_performance_log(driver)
+        elapsed = time.monotonic() - self.started if self.started else 0
+        if not failed and elapsed < self.slow_seconds:
+            return None
+        reason = 'failed' if failed else f'slow ({elapsed:.1f}s)'
+        path = f"network_{re.sub(r'[^A-Za-z0-9_.-]', '_', label)}.har.json"
+        try:
+            with open(path, 'w') as f:
+                json.dump(self.to_har(label, reason), f, indent=1)
+            logging.info(f"Saved network capture of {len(self.buffer)} events for {reason} page to {path}")
+            self.dumped.append(path)
+            return path
+        except Exception as e:
+            logging.warning(f"Could not save network capture: {str(e)}")
+            return None
+
+    def to_har(self, label, reason):
+        requests_by_id = {}
+        page_events = []
+        for raw_message in self.buffer:
+            try:
+                message = json.loads(raw_message)['message']
+            except (ValueError, KeyError):
+                continue
+            method = message.get('method', '')
+            params = message.get('params', {})
+            if method.startswith('Page.'):
+                page_events.append({'method': method, 'timestamp': params.get('timestamp'),
+                                    'url': (params.get('frame') or {}).get('url')})
+                continue
+
+            request_id = params.get('requestId')
+            if not request_id:
+                continue
+            entry = requests_by_id.setdefault(request_id, {
+                'request': {}, 'response': {}, 'timings': {}, '_redirects': []
+            })
+            if method == 'Network.requestWillBeSent':
+                if params.get('redirectResponse'):
+                    entry['_redirects'].append({'url': entry['request'].get('url'),
+                                                'status': params['redirectResponse'].get('status')})
+                entry['request'] = {'method': params['request'].get('method'), 'url': params['request'].get('url')}
+                entry['_resourceType'] = params.get('type')
+                entry['_started'] = params.get('timestamp')
+                entry['startedDateTime'] = datetime.fromtimestamp(params.get('wallTime', 0), pytz.UTC).isoformat()
+            elif method == 'Network.responseReceived':
+                response = params.get('response', {})
+                entry['response'] = {'status': response.get('status'), 'statusText': response.get('statusText'),
+                                     'mimeType': response.get('mimeType'),
+                                     'fromCache': response.get('fromDiskCache') or response.get('fromServiceWorker')}
+                entry['timings'] = response.get('timing') or {}
+            elif method == 'Network.loadingFinished':
+                entry['response']['bodySize'] = params.get('encodedDataLength')
+                entry['_finished'] = params.get('timestamp')
+            elif method == 'Network.loadingFailed':
+                entry['_error'] = params.get('errorText')
+                entry['_blockedReason'] = params.get('blockedReason')
+                entry['_finished'] = params.get('timestamp')
+
+        entries = []
+        for entry in requests_by_id.values():
+            started = entry.pop('_started', None)
+            finished = entry.pop('_finished', None)
+            # None means the request never finished - usually the interesting one
+            entry['time'] = round((finished - started) * 1000, 1) if started and finished else None
+            entries.append(entry)
+        entries.sort(key=lambda e: e.get('startedDateTime') or '')
+
+        return {'log': {
+            'version': '1.2',
+            'creator': {'name': 'meetup_announcer', 'version': '1'},
+            'comment': f"{label}: {reason}; last {len(self.buffer)} CDP events (buffer size {self.buffer.maxlen})",
+            'pages': page_events,
+            'entries': entries
+        }}
+
+class RunTimings:
+    """Wall-clock durations of each phase of a run."""
+
+    def __init__(self):
+        self.started = time.monotonic()
+        self.durations = {}
+
+    @contextmanager
+    def phase(self, name):
+        start = time.monotonic()
+        try:
+            yield
+        finally:
+            self.record(name, time.monotonic() - start)
+
+    def record(self, name, seconds):
+        self.durations.setdefault(name, []).append(seconds)
+
+    def total(self):
+        return time.monotonic() - self.started
+
+    def log_summary(self):
+        logging.info(f"=== TIMINGS (total {self.total():.2f}s) ===")
+        for name, durations in self.durations.items():
+            logging.info(f"{name}: {len(durations)}x, total {sum(durations):.2f}s, "
+                         f"mean {sum(durations) / len(durations):.2f}s, max {max(durations):.2f}s")
+
+class RequestGovernor:
+    """Token-bucket rate limiter for page loads and API calls, per host.
+
+    Each host has its own bucket (rate requests per second, up to burst at
+    once). Bucket state lives in SQLite so processes sharing the database file
+    (e.g. workers sharing the work table) share the budget. When a host answers
+    with 429 or a challenge page, its rate is halved and it gets a cooldown;
+    every clean response nudges the rate back up. The rate each host settles at
+    is the sustainable throughput, and is logged at the end of the run.
+    """
+
+    def __init__(self, db_path=':memory:', default_rate=1.0, default_burst=5, host_limits=None):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.host_limits = host_limits or {}
+        self.waited = 0.0
+        self.requests = 0
+        self.throttles = 0
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        self.conn.execute('PRAGMA busy_timeout = 30000')
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS host_buckets (
+                host TEXT PRIMARY KEY,
+                tokens REAL NOT NULL,
+                updated REAL NOT NULL,
+                rate_factor REAL NOT NULL DEFAULT 1.0,
+                cooldown_until REAL NOT NULL DEFAULT 0,
+                consecutive_throttles INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+
+    @staticmethod
+    def host_of(url):
+        return urlsplit(url).hostname or ''
+
+    def limits(self, host):
+        for pattern, (rate, burst) in self.host_limits.items():
+            if host == pattern or host.endswith('.' + pattern):
+                return rate, burst
+        return self.default_rate, self.default_burst
+
+    def load(self, host, now):
+        row = self.conn.execute(
+            'SELECT tokens, updated, rate_factor, cooldown_until, consecutive_throttles FROM host_buckets WHERE host = ?',
+            (host,)
+        ).fetchone()
+        if row is None:
+            _, burst = self.limits(host)
+            row = (float(burst), now, 1.0, 0.0, 0)
+            self.conn.execute('INSERT INTO host_buckets (host, tokens, updated) VALUES (?, ?, ?)', (host, row[0], now))
+        return row
+
+    def acquire(self, url):
+        """Block until a request to url's host is allowed."""
+        host = self.host_of(url)
+        rate, burst = self.limits(host)
+        while True:
+            now = time.time()
+            self.conn.execute('BEGIN IMMEDIATE')
+            try:
+                tokens, updated, rate_factor, cooldown_until, _ = self.load(host, now)
+                effective_rate = rate * rate_factor
+                tokens = min(float(burst), tokens + (now - updated) * effective_rate)
+                if now < cooldown_until:
+                    wait = cooldown_until - now
+                elif tokens >= 1:
+                    tokens -= 1
+                    wait = 0
+                else:
+                    wait = (1 - tokens) / effective_rate
+                self.conn.execute('UPDATE host_buckets SET tokens = ?, updated = ? WHERE host = ?', (tokens, now, host))
+                self.conn.execute('COMMIT')
+            except Exception:
+                self.conn.execute('ROLLBACK')
+                raise
+
+            if wait <= 0:
+                self.requests += 1
+                return
+            if run_deadline is not None and wait > run_deadline.remaining():
+                raise DeadlineExceeded(f"Rate governor: next request to {host} is allowed in {wait:.0f}s, after the "
+                                       f"'{run_deadline.phase_name or 'run'}' budget runs out")
+            if wait > 1:
+                logging.info(f"Rate governor: waiting {wait:.1f}s before next request to {host}")
+            self.waited += wait
+            # Sleep in slices so a long cooldown doesn't look like a hang to systemd's watchdog
+            time.sleep(min(wait_timeout(wait), 10))
+            sd_watchdog_ping()
+
+    def report(self, url, throttled, retry_after=None):
+        """Feed back the outcome of a request so the host's rate can adapt."""
+        host = self.host_of(url)
+        now = time.time()
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            _, _, rate_factor, cooldown_until, consecutive = self.load(host, now)
+            if throttled:
+                self.throttles += 1
+                consecutive += 1
+                rate_factor = max(0.05, rate_factor / 2)
+                cooldown = retry_after if retry_after else min(600, 30 * 2 ** (consecutive - 1))
+                cooldown_until = max(cooldown_until, now + cooldown)
+                logging.warning(f"Rate governor: {host} is throttling us - cooling down {cooldown:.0f}s, "
+                                f"rate now {self.limits(host)[0] * rate_factor:.2f} req/s")
+            else:
+                consecutive = 0
+                rate_factor = min(1.0, rate_factor + 0.05)
+            self.conn.execute(
+                'UPDATE host_buckets SET rate_factor = ?, cooldown_until = ?, consecutive_throttles = ? WHERE host = ?',
+                (rate_factor, cooldown_until, consecutive, host)
+            )
+            self.conn.execute('COMMIT')
+        except Exception:
+            self.conn.execute('ROLLBACK')
+            raise
+
+    def summary(self):
+        rows = self.conn.execute('SELECT host, rate_factor FROM host_buckets ORDER BY host').fetchall()
+        rates = ', '.join(f"{host} {self.limits(host)[0] * factor:.2f} req/s" for host, factor in rows)
+        return (f"Rate governor: {self.requests} requests, {self.throttles} throttled, "
+                f"{self.waited:.1f}s spent waiting; current rates: {rates or 'n/a'}")
+
+def get_request_governor():
+    """Return the run's governor, creating a private in-memory one if main() didn't set one up."""
+    global request_governor
+    if request_governor is None:
+        request_governor = RequestGovernor()
+    return request_governor
+
+def parse_rate_limit(value):
+    """Parse a HOST=RATE[:BURST] command line value."""
+    host, _, limit = value.partition('=')
+    rate, _, burst = limit.partition(':')
+    if not host or not rate:
+        raise argparse.ArgumentTypeError(f"Expected HOST=RATE[:BURST], got {value}")
+    return host, (float(rate), int(burst) if burst else 5)
+
+# Text that shows up on rate-limit and bot-challenge interstitials instead of the real page
+CHALLENGE_SCRIPT = """
+var title = (document.title || '').toLowerCase();
+var text = document.body ? document.body.innerText.slice(0, 2000).toLowerCase() : '';
+var markers = ['too many requests', 'just a moment', 'attention required', 'access denied',
+               'unusual traffic', 'verify you are human', 'are you a robot'];
+for (var i = 0; i < markers.length; i++) {
+    if (title.indexOf(markers[i]) !== -1 || text.indexOf(markers[i]) !== -1) {
+        return markers[i];
+    }
+}
+if (document.querySelector('iframe[src*="captcha"], iframe[src*="challenge"], #challenge-form')) {
+    return 'challenge form';
+}
+return null;
+"""
+
+def governed_get(driver, url, max_attempts=3):
+    """Load a page through the rate governor, backing off if we land on a throttle/challenge page."""
+    governor = get_request_governor()
+    for attempt in range(max_attempts):
+        if attempt and out_of_time():
+            break
+        governor.acquire(url)
+        sd_watchdog_ping()
+        driver.get(url)
+        sd_watchdog_ping()
+        try:
+            challenge = driver.execute_script(CHALLENGE_SCRIPT)
+        except Exception as e:
+            logging.debug(f"Could not check for challenge page: {e}")
+            challenge = None
+        governor.report(url, throttled=bool(challenge))
+        if not challenge:
+            return
+        logging.warning(f"Got a '{challenge}' page loading {url} (attempt {attempt + 1}/{max_attempts})")
+    logging.error(f"Still throttled after {max_attempts} attempts to load {url}")
+
+def record_page(driver, url):
+    """Snapshot the current page into the active recording, if there is one."""
+    if page_recorder is None:
+        return
+    try:
+        page_recorder.record(url, driver.page_source)
+    except Exception as e:
+        logging.warning(f"Could not record {url}: {str(e)}")
+
 def cleanup_previous_screenshots():
     """Clean up screenshot files from previous runs."""
     import os
@@ -121,7 +646,8 @@ def cleanup_previous_screenshots():
     
     try:
         # Get all PNG files in the current directory (screenshots)
-        screenshot_files = glob.glob("*.png")
+        # Network captures from failed events are cleaned up along with the screenshots
+        screenshot_files = glob.glob("*.png") + glob.glob("network_*.har.json")
         
         if screenshot_files:
             logging.info(f"Cleaning up {len(screenshot_files)} screenshot files from previous runs...")
@@ -152,8 +678,43 @@ def setup_display(manual_login=False):
         display.start()
         return display
 
-def setup_driver(manual_login=False):
-    """Set up and return a configured Chrome WebDriver."""
+def allocate_debugging_port():
+    """Ask the OS for a free TCP port to use as Chrome's remote debugging port."""
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+def prepare_worker_profile(worker_name):
+    """Copy the logged-in base profile into a private directory for one worker.
+
+    Chrome locks its user data directory, so concurrent workers can't share
+    chrome_profile. Each worker gets a fresh copy (minus caches and lock files)
+    so it picks up the session from the last --manual-login.
+    """
+    worker_profile = os.path.join(BASE_DIR, 'chrome_profiles', re.sub(r'[^A-Za-z0-9_.-]', '_', worker_name))
+    if os.path.exists(worker_profile):
+        shutil.rmtree(worker_profile, ignore_errors=True)
+
+    if os.path.exists(DEFAULT_PROFILE_PATH):
+        shutil.copytree(
+            DEFAULT_PROFILE_PATH,
+            worker_profile,
+            ignore=shutil.ignore_patterns('Singleton*', 'Cache', 'Code Cache', 'GPUCache', 'ShaderCache', '*.lock'),
+            symlinks=True
+        )
+        logging.info(f"Copied Chrome profile for worker {worker_name} to {worker_profile}")
+    else:
+        os.makedirs(worker_profile, mode=0o755)
+        logging.warning(f"Base Chrome profile {DEFAULT_PROFILE_PATH} not found - worker {worker_name} starts logged out")
+
+    return worker_profile
+
+def setup_driver(manual_login=False, debugging_port=DEFAULT_DEBUGGING_PORT, profile_path=DEFAULT_PROFILE_PATH,
+                 low_memory=False):
+    """Set up and return a configured Chrome WebDriver.
+
+    low_memory trades some speed for a smaller footprint on small VMs.
+    """
     chrome_options = Options()
     chrome_options.add_argument('--no-sandbox')
     chrome_options.add_argument('--disable-dev-shm-usage')
@@ -189,9 +750,6 @@ def setup_driver(manual_login=False):
     chrome_options.add_argument('--silent')
     
     # Set up persistent Chrome profile directory with error handling
-    import os
-    profile_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'chrome_profile')
-    
     # Ensure the profile directory exists and has proper permissions
     try:
         if not os.path.exists(profile_path):
@@ -220,13 +778,29 @@ def setup_driver(manual_login=False):
     else:
         logging.info("Running in visible mode for manual login")
     
-    chrome_options.add_argument('--remote-debugging-port=9222')
-    chrome_options.add_argument('--user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36')
+    if low_memory:
+        # Fewer renderer processes, capped caches and a capped V8 heap
+        chrome_options.add_argument('--renderer-process-limit=1')
+        chrome_options.add_argument('--disk-cache-size=33554432')  # 32 MB
+        chrome_options.add_argument('--media-cache-size=1048576')  # 1 MB
+        chrome_options.add_argument('--js-flags=--max-old-space-size=256')
+        chrome_options.add_argument('--aggressive-cache-discard')
+        chrome_options.add_argument('--disable-back-forward-cache')
+        chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+        logging.info("Running in low-memory mode")
+    
+    chrome_options.add_argument(f'--remote-debugging-port={debugging_port}')
+    chrome_options.add_argument(f'--user-agent={USER_AGENT}')
     chrome_options.add_argument('--binary=/usr/bin/chromium')
     
     # Set page load strategy to eager to prevent timeouts
     chrome_options.page_load_strategy = 'eager'
     
+    # Performance logging gives us CDP Network events (to confirm announces) and,
+    # for the network recorder, Page events
+    chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    chrome_options.add_experimental_option('perfLoggingPrefs', {'enableNetwork': True, 'enablePage': bool(network_recorder)})
+    
     # Add experimental options
     chrome_options.add_experimental_option('excludeSwitches', ['enable-automation'])
     chrome_options.add_experimental_option('useAutomationExtension', False)
@@ -241,16 +815,122 @@ def setup_driver(manual_login=False):
     
     return driver
 
+def get_process_tree_rss(root_pid):
+    """Return the total resident memory in bytes of a process and all its descendants.
+
+    Reads /proc directly, so it only works on Linux; returns 0 elsewhere.
+    """
+    children = {}
+    try:
+        pids = [entry for entry in os.listdir('/proc') if entry.isdigit()]
+    except OSError:
+        return 0
+
+    for pid in pids:
+        try:
+            with open(f'/proc/{pid}/stat', 'r') as f:
+                stat = f.read()
+        except OSError:
+            continue
+        # The command name may contain spaces and parentheses, so split after the last ')'
+        parent_pid = int(stat.rsplit(')', 1)[1].split()[1])
+        children.setdefault(parent_pid, []).append(int(pid))
+
+    total_kb = 0
+    pending = [root_pid]
+    while pending:
+        pid = pending.pop()
+        try:
+            with open(f'/proc/{pid}/status', 'r') as f:
+                for line in f:
+                    if line.startswith('VmRSS:'):
+                        total_kb += int(line.split()[1])
+                        break
+        except OSError:
+            continue
+        pending.extend(children.get(pid, []))
+
+    return total_kb * 1024
+
+class MemoryWatchdog:
+    """Keeps Chromium's memory in check between events.
+
+    Samples the RSS of the chromedriver/Chromium process tree. When it passes
+    the limit, the current tab is swapped for a fresh one; if that doesn't
+    bring it back under, the driver is restarted with driver_factory. The
+    caller keeps going with the driver returned by check(), so processing
+    resumes with the next event. The peak RSS seen is kept for the summary.
+    """
+
+    def __init__(self, driver, driver_factory, limit_mb=None):
+        self.driver = driver
+        self.driver_factory = driver_factory
+        self.limit_bytes = limit_mb * 1024 * 1024 if limit_mb else None
+        self.peak_bytes = 0
+        self.tab_recycles = 0
+        self.driver_restarts = 0
+
+    def sample(self):
+        try:
+            rss = get_process_tree_rss(self.driver.service.process.pid)
+        except Exception as e:
+            logging.debug(f"Could not sample browser memory: {e}")
+            return 0
+        self.peak_bytes = max(self.peak_bytes, rss)
+        return rss
+
+    def recycle_tab(self):
+        old_handle = self.driver.current_window_handle
+        self.driver.switch_to.new_window('tab')
+        new_handle = self.driver.current_window_handle
+        self.driver.switch_to.window(old_handle)
+        self.driver.close()
+        self.driver.switch_to.window(new_handle)
+        self.tab_recycles += 1
+
+    def restart_driver(self):
+        try:
+            self.driver.quit()
+        except Exception as e:
+            logging.warning(f"Error quitting driver during restart: {str(e)}")
+        self.driver = self.driver_factory()
+        self.driver_restarts += 1
+
+    def check(self, driver):
+        """Sample memory and recycle if needed. Returns the driver to continue with."""
+        self.driver = driver
+        rss = self.sample()
+        if not self.limit_bytes or rss <= self.limit_bytes:
+            return self.driver
+
+        logging.warning(f"Browser RSS {rss / 1048576:.0f} MB is over the {self.limit_bytes / 1048576:.0f} MB limit - recycling tab")
+        try:
+            self.recycle_tab()
+            rss = self.sample()
+        except Exception as e:
+            logging.warning(f"Could not recycle tab: {str(e)}")
+
+        if rss > self.limit_bytes:
+            logging.warning(f"Browser RSS still {rss / 1048576:.0f} MB after recycling tab - restarting driver")
+            self.restart_driver()
+            self.sample()
+
+        return self.driver
+
+    def summary(self):
+        return (f"Peak browser RSS: {self.peak_bytes / 1048576:.0f} MB "
+                f"(tab recycles: {self.tab_recycles}, driver restarts: {self.driver_restarts})")
+
 def manual_login(driver, group_url):
     """Handle manual login process"""
     logging.info("Starting manual login process...")
     
     try:
         logging.info(f"Navigating to: {group_url}")
-        driver.get(f"{group_url}")
+        governed_get(driver, f"{group_url}")
         
         # Wait for page to load
-        time.sleep(3)
+        deadline_sleep(3)
         
         # Check if navigation was successful
         current_url = driver.current_url
@@ -261,8 +941,8 @@ def manual_login(driver, group_url):
             logging.info("Attempting to navigate again...")
             
             # Try navigating again
-            driver.get("https://www.meetup.com")
-            time.sleep(3)
+            governed_get(driver, "https://www.meetup.com")
+            deadline_sleep(3)
             current_url = driver.current_url
             logging.info(f"Current URL after second attempt: {current_url}")
             
@@ -294,7 +974,7 @@ def manual_login(driver, group_url):
     
     # Take a screenshot for debugging
     try:
-        driver.save_screenshot('login_verification_screenshot.png')
+        driver.save_screenshot(run_file('login_verification_screenshot.png'))
         logging.info("Saved screenshot for login verification debugging")
     except Exception as e:
         logging.warning(f"Could not save screenshot: {str(e)}")
@@ -326,7 +1006,7 @@ def manual_login(driver, group_url):
     for selector in profile_selectors:
         try:
             logging.info(f"Trying profile selector: {selector}")
-            element = WebDriverWait(driver, 0.5).until(  # Reduced from 3 seconds to 0.5 seconds
+            element = WebDriverWait(driver, wait_timeout(0.5)).until(  # Reduced from 3 seconds to 0.5 seconds
                 EC.presence_of_element_located((By.CSS_SELECTOR, selector))
             )
             if element.is_displayed():
@@ -386,8 +1066,8 @@ def automated_login(driver, group_url):
         logging.info("Attempting automated login...")
         
         # Navigate to Meetup login page
-        driver.get("https://www.meetup.com/login/")
-        time.sleep(3)
+        governed_get(driver, "https://www.meetup.com/login/")
+        deadline_sleep(3)
         
         # Look for email input field
         email_selectors = [
@@ -400,7 +1080,7 @@ def automated_login(driver, group_url):
         email_input = None
         for selector in email_selectors:
             try:
-                email_input = WebDriverWait(driver, 5).until(
+                email_input = WebDriverWait(driver, wait_timeout(5)).until(
                     EC.presence_of_element_located((By.CSS_SELECTOR, selector))
                 )
                 if email_input.is_displayed():
@@ -477,7 +1157,7 @@ def automated_login(driver, group_url):
         logging.info("Clicked login button")
         
         # Wait for login to complete
-        time.sleep(5)
+        deadline_sleep(5)
         
         # Check if login was successful
         if check_authentication(driver, group_url):
@@ -491,6 +1171,182 @@ def automated_login(driver, group_url):
         logging.error(f"Error during automated login: {str(e)}")
         return False
 
+# Cookies that only exist while logged in to meetup.com
+SESSION_COOKIE_NAMES = ['MEETUP_MEMBER', 'MEETUP_SESSION']
+# Chrome stores cookie times as microseconds since 1601-01-01 UTC
+CHROME_EPOCH = datetime(1601, 1, 1, tzinfo=pytz.UTC)
+# Answers with the logged-in member, or null when the cookies aren't a valid session
+SESSION_PROBE_QUERY = 'query { self { id } }'
+
+# When we last sent each kind of login email (session expiring, logged out, ...)
+SESSION_WARNING_FILE = os.path.join(BASE_DIR, 'session_warning.json')
+
+SessionStatus = namedtuple('SessionStatus', ['logged_in', 'expires', 'confirmed', 'problem'])
+
+def read_profile_cookies(profile_path=DEFAULT_PROFILE_PATH, host_suffix='meetup.com'):
+    """Read a Chrome profile's cookies for a site straight from its cookie database.
+
+    The database is copied first because a running Chrome keeps it locked.
+    Returns (cookies, db_version); cookie values may still be encrypted.
+    """
+    candidates = [os.path.join(profile_path, 'Default', 'Network', 'Cookies'),
+                  os.path.join(profile_path, 'Default', 'Cookies')]
+    db_path = next((path for path in candidates if os.path.exists(path)), None)
+    if not db_path:
+        raise FileNotFoundError(f"No cookie database in {profile_path}")
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        copy_path = os.path.join(tmp_dir, 'Cookies')
+        for suffix in ('', '-wal', '-journal'):
+            if os.path.exists(db_path + suffix):
+                shutil.copy2(db_path + suffix, copy_path + suffix)
+        conn = sqlite3.connect(copy_path)
+        try:
+            try:
+                db_version = int(conn.execute("SELECT value FROM meta WHERE key = 'version'").fetchone()[0])
+            except Exception:
+                db_version = 0
+            rows = conn.execute(
+                "SELECT name, host_key, expires_utc, value, encrypted_value FROM cookies WHERE host_key LIKE ?",
+                (f'%{host_suffix}',)
+            ).fetchall()
+        finally:
+            conn.close()
+
+    cookies = []
+    for name, host_key, expires_utc, value, encrypted_value in rows:
+        cookies.append({
+            'name': name,
+            'host': host_key,
+            # 0 means a cookie that lasts as long as the browser session
+            'expires': CHROME_EPOCH + timedelta(microseconds=expires_utc) if expires_utc else None,
+            'value': value,
+            'encrypted_value': encrypted_value
+        })
+    return cookies, db_version
+
+def decrypt_cookie_value(cookie, db_version):
+    """Decrypt a cookie Chrome stored with --password-store=basic. Returns None if we can't."""
+    encrypted = cookie['encrypted_value']
+    if not encrypted:
+        return cookie['value']
+    # v11 values are keyed by the desktop keyring, which our Chrome never uses
+    if not encrypted.startswith(b'v10'):
+        return None
+    try:
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    except ImportError:
+        return None
+
+    # Chrome's fixed key for the basic password store on Linux
+    key = hashlib.pbkdf2_hmac('sha1', b'peanuts', b'saltysalt', 1, 16)
+    decryptor = Cipher(algorithms.AES(key), modes.CBC(b' ' * 16)).decryptor()
+    plain = decryptor.update(encrypted[3:]) + decryptor.finalize()
+    plain = plain[:-plain[-1]]
+    if db_version >= 24:
+        # Newer databases prefix the value with a SHA-256 of the cookie's domain
+        plain = plain[32:]
+    return plain.decode('utf-8')
+
+def confirm_session(cookies, db_version, endpoint=None):
+    """Ask Meetup who the cookies belong to. Returns (confirmed, problem)."""
+    endpoint = endpoint or ANNOUNCE_API_URL
+    values = {cookie['name']: decrypt_cookie_value(cookie, db_version) for cookie in cookies}
+    if any(values[name] is None for name in SESSION_COOKIE_NAMES if name in values):
+        logging.warning("Could not decrypt the session cookies (is the cryptography package installed?) - "
+                        "skipping the HTTP confirmation")
+        return False, None
+
+    cookie_header = '; '.join(f"{name}={value}" for name, value in values.items() if value is not None)
+    try:
+        get_request_governor().acquire(endpoint)
+        response = requests.post(endpoint, json={'query': SESSION_PROBE_QUERY},
+                                 headers={'Cookie': cookie_header, 'User-Agent': USER_AGENT}, timeout=10)
+        body = response.json()
+    except (requests.RequestException, ValueError) as e:
+        logging.warning(f"Session confirmation request failed, relying on the cookies alone: {str(e)}")
+        return False, None
+
+    if not (body.get('data') or {}).get('self'):
+        return False, f"Meetup does not recognise the session (HTTP {response.status_code})"
+    return True, None
+
+def check_session(profile_path=DEFAULT_PROFILE_PATH, confirm=False):
+    """Check the saved login without starting a browser, from the profile's cookie database."""
+    try:
+        cookies, db_version = read_profile_cookies(profile_path)
+    except Exception as e:
+        return SessionStatus(False, None, False, f"Could not read the cookie database: {str(e)}")
+
+    # The session only works while every one of its cookies is there, so it ends with the first to expire
+    now = datetime.now(pytz.UTC)
+    session_cookies = {cookie['name']: cookie for cookie in cookies if cookie['name'] in SESSION_COOKIE_NAMES}
+    missing = [name for name in SESSION_COOKIE_NAMES if name not in session_cookies]
+    if missing:
+        return SessionStatus(False, None, False, f"Missing meetup.com session cookies: {', '.join(missing)}")
+    expired = [name for name, cookie in session_cookies.items() if cookie['expires'] and cookie['expires'] <= now]
+    if expired:
+        return SessionStatus(False, None, False, f"Session cookies expired: {', '.join(sorted(expired))}")
+
+    expiries = [cookie['expires'] for cookie in session_cookies.values() if cookie['expires']]
+    expires = min(expiries) if expiries else None
+
+    confirmed = False
+    if confirm:
+        confirmed, problem = confirm_session(cookies, db_version)
+        if problem:
+            return SessionStatus(False, expires, False, problem)
+    return SessionStatus(True, expires, confirmed, None)
+
+def send_daily_email(kind, error_message, log_file_path, screenshot_path=None):
+    """Send an error email unless one of this kind already went out in the last day.
+
+    Hourly scheduled runs keep running into the same problem until someone
+    fixes it, so problems like a lost login are only emailed once a day.
+    """
+    try:
+        with open(SESSION_WARNING_FILE, 'r') as f:
+            sent = json.load(f)
+    except Exception:
+        sent = {}
+    last_sent = sent.get(kind)
+    try:
+        if last_sent and datetime.now() - datetime.fromisoformat(last_sent) < timedelta(days=1):
+            logging.info(f"Not emailing about {kind} again - already emailed at {last_sent}")
+            return
+    except (TypeError, ValueError):
+        pass
+    send_error_email(error_message, log_file_path, screenshot_path)
+    sent[kind] = datetime.now().isoformat()
+    try:
+        with open(SESSION_WARNING_FILE, 'w') as f:
+            json.dump(sent, f, indent=2, sort_keys=True)
+    except Exception as e:
+        logging.warning(f"Could not record the {kind} email in {SESSION_WARNING_FILE}: {str(e)}")
+
+def report_session(status, warn_days):
+    """Log the session status and email when it is gone or about to expire. Returns True if logged in."""
+    login_instructions = ("Please run the script with --manual-login to authenticate:\n\n"
+                          "ssh -Y almalinux\n"
+                          "cd /var/www/meetup_automation\n"
+                          "source venv/bin/activate\n"
+                          "python meetup_announcer.py --manual-login --group-url \"https://www.meetup.com/joyful-parenting-sf/\"\n\n"
+                          "Then log in through the browser window that appears.")
+    if not status.logged_in:
+        logging.error(f"Session check failed: {status.problem}")
+        send_daily_email('logged_out', f"AUTHENTICATION ISSUE: {status.problem}. {login_instructions}",
+                         run_file('meetup_announcer.log'))
+        return False
+
+    expires_text = status.expires.isoformat() if status.expires else 'at the end of the browser session'
+    logging.info(f"Session OK{' (confirmed by Meetup)' if status.confirmed else ''}, expires {expires_text}")
+    if status.expires and status.expires - datetime.now(pytz.UTC) < timedelta(days=warn_days):
+        logging.warning(f"Session expires within {warn_days} days")
+        send_daily_email('session_expiring',
+                         f"SESSION EXPIRING: The Meetup login expires at {expires_text}. {login_instructions}",
+                         run_file('meetup_announcer.log'))
+    return True
+
 def check_authentication(driver, group_url):
     """Check if the user is properly authenticated."""
     try:
@@ -498,8 +1354,9 @@ def check_authentication(driver, group_url):
         
         # Navigate to the specific group page to check authentication
         logging.info(f"Navigating to group page: {group_url}")
-        driver.get(group_url)
-        time.sleep(3)  # Wait for page to load
+        governed_get(driver, group_url)
+        deadline_sleep(3)  # Wait for page to load
+        record_page(driver, group_url)
         
         # Look for elements that indicate we're logged in
         login_indicators = [
@@ -514,8 +1371,9 @@ def check_authentication(driver, group_url):
         ]
         
         for indicator in login_indicators:
+            sd_watchdog_ping()
             try:
-                element = WebDriverWait(driver, 2).until(  # Increased from 0.5 to 2 seconds
+                element = WebDriverWait(driver, wait_timeout(2)).until(  # Increased from 0.5 to 2 seconds
                     EC.presence_of_element_located((By.CSS_SELECTOR, indicator))
                 )
                 if element.is_displayed():
@@ -534,6 +1392,7 @@ def check_authentication(driver, group_url):
         ]
         
         for indicator in login_page_indicators:
+            sd_watchdog_ping()
             try:
                 element = driver.find_element(By.CSS_SELECTOR, indicator)
                 if element.is_displayed():
@@ -552,6 +1411,8 @@ def check_authentication(driver, group_url):
         logging.warning("Could not find clear authentication indicators - assuming not logged in")
         return False
         
+    except DeadlineExceeded:
+        raise
     except Exception as e:
         logging.error(f"Error checking authentication: {str(e)}")
         return False
@@ -562,8 +1423,8 @@ def check_organizer_permissions(driver, group_url):
         logging.info("Checking organizer permissions...")
         
         # Navigate to group page
-        driver.get(group_url)
-        time.sleep(3)
+        governed_get(driver, group_url)
+        deadline_sleep(3)
         
         # Look for the "Manage group" button - this is the most reliable indicator
         manage_group_selectors = [
@@ -574,6 +1435,7 @@ def check_organizer_permissions(driver, group_url):
         ]
         
         for selector in manage_group_selectors:
+            sd_watchdog_ping()
             try:
                 if 'contains' in selector:
                     # Use XPath for contains
@@ -590,50 +1452,61 @@ def check_organizer_permissions(driver, group_url):
         logging.warning("No 'Manage group' button found - user may not have organizer permissions")
         return False
         
+    except DeadlineExceeded:
+        raise
     except Exception as e:
         logging.error(f"Error checking organizer permissions: {str(e)}")
         return False
 
-def is_event_within_range(event_date_str):
-    """Check if event is within the next 18 days or in the past."""
-    try:
-        logging.info(f"Parsing date: {event_date_str}")
+# Events are announced once they are this many days away (or closer)
+ANNOUNCE_WINDOW_DAYS = 18
 
-        # Clean recurring event prefix (e.g., "Every Sat • ")
-        event_date_str = re.sub(r'^Every\s+\w+\s*[•·]\s*', '', event_date_str)
+def parse_event_date(event_date_str):
+    """Parse the date text from an event card into a datetime. Raises if it can't be parsed."""
+    logging.info(f"Parsing date: {event_date_str}")
 
-        # Replace middle dot with hyphen for parsing
-        event_date_str = event_date_str.replace('·', '-').replace('•', '-')
+    # Clean recurring event prefix (e.g., "Every Sat • ")
+    event_date_str = re.sub(r'^Every\s+\w+\s*[•·]\s*', '', event_date_str)
 
-        logging.info(f"Cleaned date string: {event_date_str}")
+    # Replace middle dot with hyphen for parsing
+    event_date_str = event_date_str.replace('·', '-').replace('•', '-')
 
-        # Handle timezone abbreviations
-        tz_map = {
-            'PDT': 'America/Los_Angeles',
-            'PST': 'America/Los_Angeles',
-            'EDT': 'America/New_York',
-            'EST': 'America/New_York'
-        }
-        
-        # Replace timezone abbreviation if present
-        for tz_abbr, tz_name in tz_map.items():
-            if tz_abbr in event_date_str:
-                # Replace timezone abbreviation
-                cleaned_date_str = event_date_str.replace(tz_abbr, '').strip()
-                logging.info(f"Cleaned date string: {cleaned_date_str}")
-                
-                # Parse without timezone first
-                date_obj = date_parser.parse(cleaned_date_str)
-                
-                # Then apply the timezone
-                tz = pytz.timezone(tz_name)
-                event_date = tz.localize(date_obj)
-                logging.info(f"Applied timezone {tz_name} to date: {event_date}")
-                break
-        else:
-            # If no timezone abbreviation found, use default parser
-            event_date = date_parser.parse(event_date_str)
-            logging.info(f"Using default parser: {event_date}")
+    logging.info(f"Cleaned date string: {event_date_str}")
+
+    # Handle timezone abbreviations
+    tz_map = {
+        'PDT': 'America/Los_Angeles',
+        'PST': 'America/Los_Angeles',
+        'EDT': 'America/New_York',
+        'EST': 'America/New_York'
+    }
+    
+    # Replace timezone abbreviation if present
+    for tz_abbr, tz_name in tz_map.items():
+        if tz_abbr in event_date_str:
+            # Replace timezone abbreviation
+            cleaned_date_str = event_date_str.replace(tz_abbr, '').strip()
+            logging.info(f"Cleaned date string: {cleaned_date_str}")
+            
+            # Parse without timezone first
+            date_obj = date_parser.parse(cleaned_date_str)
+            
+            # Then apply the timezone
+            tz = pytz.timezone(tz_name)
+            event_date = tz.localize(date_obj)
+            logging.info(f"Applied timezone {tz_name} to date: {event_date}")
+            break
+    else:
+        # If no timezone abbreviation found, use default parser
+        event_date = date_parser.parse(event_date_str)
+        logging.info(f"Using default parser: {event_date}")
+
+    return event_date
+
+def is_event_within_range(event_date_str):
+    """Check if event is within the next 18 days or in the past."""
+    try:
+        event_date = parse_event_date(event_date_str)
         
         # Get current date in the same timezone
         if event_date.tzinfo:
@@ -649,473 +1522,2241 @@ def is_event_within_range(event_date_str):
         logging.info(f"Days until event: {date_range.days}")
         
         # Check if event is within next 18 days or in the past
-        return date_range.days <= 18
+        return date_range.days <= ANNOUNCE_WINDOW_DAYS
     except Exception as e:
         logging.error(f"Error parsing date {event_date_str}: {str(e)}")
         # Return True to process the event anyway if we can't parse the date
         return True
 
-def announce_events(driver, group_url):
-    """Navigate to events page and announce events."""
-    events_processed = 0
-    events_announced = 0
-    events_failed_to_announce = 0
-    failed_events = []
-    
+# Small record describing an event page, read from the page's embedded state
+EventState = namedtuple('EventState', ['event_id', 'status', 'is_announced', 'start_time', 'organizer_actions'])
+
+# Reads the event object that Meetup embeds in the page (Next.js / Apollo state) and
+# returns only the handful of fields we need, so the page source never crosses the wire
+EVENT_STATE_SCRIPT = """
+var eventId = arguments[0];
+// Without an event object, do the old whole-page check for cancellation inside the browser
+function pageFallback() {
+    if (document.documentElement.innerHTML.indexOf('"status":"CANCELLED"') !== -1) {
+        return {id: null, status: 'CANCELLED', is_announced: null, start_time: null, organizer_actions: []};
+    }
+    return null;
+}
+var data = window.__NEXT_DATA__;
+if (!data) {
+    var el = document.getElementById('__NEXT_DATA__');
+    if (el) {
+        try { data = JSON.parse(el.textContent); } catch (e) { data = null; }
+    }
+}
+if (!data || !data.props || !data.props.pageProps) {
+    return pageFallback();
+}
+var pageProps = data.props.pageProps;
+var apollo = pageProps.__APOLLO_STATE__ || pageProps.apolloState || {};
+var ev = null;
+for (var key in apollo) {
+    if (key.indexOf('Event:') !== 0) continue;
+    if (!eventId || String(apollo[key].id) === String(eventId)) {
+        ev = apollo[key];
+        break;
+    }
+}
+if (!ev && pageProps.event) {
+    ev = pageProps.event;
+}
+if (!ev) {
+    return pageFallback();
+}
+var announced = null;
+if (ev.isAnnounced !== undefined && ev.isAnnounced !== null) {
+    announced = !!ev.isAnnounced;
+} else if (ev.announced !== undefined && ev.announced !== null) {
+    announced = !!ev.announced;
+}
+var actions = ev.actions || ev.organizerActions || ev.eventActions || [];
+if (!Array.isArray(actions)) {
+    actions = Object.keys(actions).filter(function (k) { return actions[k]; });
+}
+return {
+    id: ev.id ? String(ev.id) : null,
+    status: ev.status || null,
+    is_announced: announced,
+    start_time: ev.dateTime || ev.startTime || null,
+    organizer_actions: actions.map(String)
+};
+"""
+
+def extract_event_id(event_url):
+    """Return the event id from a Meetup event URL, or None if there isn't one."""
+    match = re.search(r'/events/([A-Za-z0-9]+)(?:[/?#]|$)', event_url or '')
+    if not match:
+        return None
+    return match.group(1)
+
+# Path segments after /events/ that are listing tabs or tools, not event ids
+NON_EVENT_SEGMENTS = {'past', 'upcoming', 'calendar', 'create', 'draft', 'drafts', 'proposed', 'ical', 'rss'}
+
+def canonical_event_url(url):
+    """Reduce a link to an event to https://www.meetup.com/<group>/events/<id>/.
+
+    Query strings, fragments and sub-pages (e.g. /attendees/) are dropped.
+    Returns None for links that aren't to a single event, like the events tab.
+    """
+    parts = urlsplit(url or '')
+    match = re.match(r'^(/[^/]+)/events/([A-Za-z0-9]+)(?:/|$)', parts.path)
+    if not match or match.group(2).lower() in NON_EVENT_SEGMENTS:
+        return None
+    return f"{parts.scheme or 'https'}://{parts.netloc or 'www.meetup.com'}{match.group(1)}/events/{match.group(2)}/"
+
+def index_event_urls(event_urls):
+    """Canonicalize (url, date) pairs and keep the first link to each event.
+
+    Returns (unique event urls, number of duplicate links, number of non-event links).
+    """
+    index = {}
+    duplicates = 0
+    non_events = 0
+    for event_url, event_date in event_urls:
+        canonical_url = canonical_event_url(event_url)
+        if not canonical_url:
+            logging.debug(f"Ignoring non-event link {event_url}")
+            non_events += 1
+        elif canonical_url in index:
+            duplicates += 1
+        else:
+            index[canonical_url] = (canonical_url, event_date)
+    return list(index.values()), duplicates, non_events
+
+def get_event_state(driver, event_url):
+    """Read the embedded event object for the current event page.
+
+    Returns an EventState, or None if the page doesn't expose its state.
+    """
+    event_id = extract_event_id(event_url)
     try:
-        # First, check if we're authenticated
-        if not check_authentication(driver, group_url):
-            error_message = ("AUTHENTICATION ISSUE: The script is not logged in to Meetup.com. "
-                           "This is likely why no announce buttons are being found. "
-                           "Please run the script with --manual-login to authenticate:\n\n"
-                           "ssh -Y almalinux\n"
-                           "cd /var/www/meetup_automation\n"
-                           "source venv/bin/activate\n"
-                           "python meetup_announcer.py --manual-login --group-url \"https://www.meetup.com/joyful-parenting-sf/\"\n\n"
-                           "Then log in through the browser window that appears.")
-            
-            logging.error("Authentication check failed - not logged in")
-            send_error_email(
-                error_message,
-                'meetup_announcer.log',
-                'authentication_error_screenshot.png'
-            )
-            
-            # Take screenshot for debugging
+        raw_state = driver.execute_script(EVENT_STATE_SCRIPT, event_id)
+    except Exception as e:
+        logging.warning(f"Could not read event state from page: {str(e)}")
+        return None
+
+    if not raw_state:
+        logging.info("Event page did not expose an embedded event object")
+        return None
+
+    state = EventState(
+        event_id=raw_state.get('id') or event_id,
+        status=(raw_state.get('status') or '').upper() or None,
+        is_announced=raw_state.get('is_announced'),
+        start_time=raw_state.get('start_time'),
+        organizer_actions=tuple(raw_state.get('organizer_actions') or ())
+    )
+    logging.info(f"Event state: id={state.event_id} status={state.status} "
+                 f"announced={state.is_announced} start={state.start_time}")
+    return state
+
+# How long to wait for the Announce button's request to come back
+ANNOUNCE_CONFIRM_SECONDS = 15
+
+# Clicks a confirm button, but only inside a dialog the site actually opened
+CONFIRM_DIALOG_SCRIPT = """
+const buttons = document.querySelectorAll('[role="dialog"] button, [role="alertdialog"] button, [aria-modal="true"] button');
+for (const button of buttons) {
+    const label = button.textContent.trim();
+    if (/Confirm|Send|Yes/.test(label) && button.offsetParent !== null && !button.disabled) {
+        button.click();
+        return label;
+    }
+}
+return null;
+"""
+
+# Why the event being processed came out 'failed', for the failure email
+last_failure_reason = None
+
+def announce_failed(reason):
+    """Log why an event couldn't be announced, remember it for the report and return 'failed'."""
+    global last_failure_reason
+    last_failure_reason = reason
+    logging.warning(reason)
+    return 'failed'
+
+def read_announce_response(driver, request_id, status, is_announce):
+    """Fetch the body of a request the browser sent after the click through CDP and check it.
+
+    is_announce says the request body was an announceEvent mutation. Other
+    requests to the announce endpoint only count if their response answers
+    announceEvent; otherwise None is returned and we keep waiting.
+    """
+    if status and status != 200:
+        if not is_announce:
+            return None
+        return announce_failed(f"Announce request returned HTTP {status}")
+    try:
+        response = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': request_id})
+        body = response.get('body', '')
+        if response.get('base64Encoded'):
+            body = base64.b64decode(body).decode('utf-8')
+        body = json.loads(body)
+    except Exception as e:
+        if not is_announce:
+            return None
+        logging.warning(f"Announce request returned HTTP {status} but its response could not be read: {str(e)}")
+        return 'announced'
+
+    if not is_announce and not (isinstance(body, dict) and 'announceEvent' in (body.get('data') or {})):
+        return None
+    error = check_announce_response(body)
+    if error:
+        return announce_failed(f"Server did not announce the event: {error}")
+    logging.info("Server confirmed the event is announced")
+    return 'announced'
+
+def wait_for_announce_response(driver, announce_endpoint=None, timeout=ANNOUNCE_CONFIRM_SECONDS):
+    """Watch the network for the request the Announce button sends and return its outcome.
+
+    The request is recognised by an announceEvent mutation in its body, or by
+    being a POST to announce_endpoint that gets an announceEvent answer.
+    Returns 'announced' or 'failed' as soon as the response arrives. A confirm
+    dialog is only clicked if the site opens one before the request goes out.
+    A click that sends nothing within the timeout is 'failed'. Returns None if
+    Chrome's performance log isn't available.
+    """
+    endpoint = urlsplit(announce_endpoint or ANNOUNCE_API_URL)
+    # request id -> [body is an announceEvent mutation, HTTP status]
+    candidates = {}
+    dialog_confirmed = False
+    give_up_at = time.monotonic() + wait_timeout(timeout)
+
+    while time.monotonic() < give_up_at:
+        sd_watchdog_ping()
+        messages = drain_performance_log(driver)
+        if messages is None:
+            return None
+
+        for raw_message in messages:
             try:
-                driver.save_screenshot('authentication_error_screenshot.png')
-                logging.info("Saved authentication error screenshot")
-            except:
-                logging.error("Could not save authentication error screenshot")
-            
-            return
-        
-        logging.info("Authentication check passed - user appears to be logged in")
-        
-        # Check organizer permissions
-        if not check_organizer_permissions(driver, group_url):
-            error_message = ("ORGANIZER PERMISSIONS ISSUE: The logged-in user does not appear to have "
-                           "organizer permissions for this Meetup group. Only organizers can announce events. "
-                           "Please verify that the logged-in account has organizer access to the group.")
-            
-            logging.error("Organizer permissions check failed")
-            send_error_email(
-                error_message,
-                'meetup_announcer.log',
-                'permissions_error_screenshot.png'
-            )
-            
-            # Take screenshot for debugging
-            try:
-                driver.save_screenshot('permissions_error_screenshot.png')
-                logging.info("Saved permissions error screenshot")
-            except:
-                logging.error("Could not save permissions error screenshot")
-            
-            return
-        
-        logging.info("Organizer permissions check passed")
-        
-        events_url = f"{group_url}events/"
-        logging.info(f"Attempting to navigate to: {events_url}")
-        
-        # Add retry logic for page load
-        max_retries = 3
-        for attempt in range(max_retries):
+                message = json.loads(raw_message)['message']
+            except (ValueError, KeyError):
+                continue
+            method = message.get('method')
+            params = message.get('params', {})
+            request_id = params.get('requestId')
+
+            if method == 'Network.requestWillBeSent':
+                request = params.get('request', {})
+                if request.get('method') != 'POST':
+                    continue
+                post_data = request.get('postData')
+                if post_data is None and request.get('hasPostData'):
+                    try:
+                        post_data = driver.execute_cdp_cmd('Network.getRequestPostData', {'requestId': request_id}).get('postData')
+                    except Exception:
+                        post_data = None
+                url = urlsplit(request.get('url', ''))
+                is_announce = bool(post_data and 'announceEvent' in post_data)
+                if is_announce or (url.netloc, url.path.rstrip('/')) == (endpoint.netloc, endpoint.path.rstrip('/')):
+                    candidates[request_id] = [is_announce, None]
+                    if is_announce:
+                        logging.info(f"Announce request sent to {request.get('url')}")
+                continue
+
+            if request_id not in candidates:
+                continue
+            is_announce = candidates[request_id][0]
+            if method == 'Network.responseReceived':
+                candidates[request_id][1] = params.get('response', {}).get('status')
+            elif method == 'Network.loadingFailed':
+                if is_announce:
+                    return announce_failed(f"Announce request failed: {params.get('errorText')}")
+                del candidates[request_id]
+            elif method == 'Network.loadingFinished':
+                outcome = read_announce_response(driver, request_id, candidates[request_id][1], is_announce)
+                if outcome:
+                    return outcome
+                del candidates[request_id]
+
+        if not candidates and not dialog_confirmed:
             try:
-                driver.get(events_url)
-                logging.info(f"Successfully navigated to events page: {events_url}")
-                break
+                label = driver.execute_script(CONFIRM_DIALOG_SCRIPT)
             except Exception as e:
-                if attempt == max_retries - 1:
-                    raise
-                logging.warning(f"Attempt {attempt + 1} failed to load page: {str(e)}")
-                time.sleep(5)  # Wait before retrying
-        
-        # Wait for event cards with increased timeout
-        logging.info("Waiting for event cards to load...")
-        wait = WebDriverWait(driver, 30)  # Increase timeout to 30 seconds
-        
-        # Try multiple selectors with increased timeouts
-        selectors = [
-            'a[id^="event-card-e-"]',
-            'a[data-event-label^="event-card-"]',
-            'a[href*="/events/"]'
+                logging.debug(f"Could not check for a confirmation dialog: {e}")
+                label = None
+            if label:
+                logging.info(f"Clicked confirmation button '{label}'")
+                dialog_confirmed = True
+        time.sleep(0.2)
+
+    if not any(is_announce for is_announce, _ in candidates.values()):
+        return announce_failed(f"No announce request was sent within {timeout}s of clicking Announce - the click was ignored")
+    return announce_failed(f"No response to the announce request within {timeout}s")
+
+def announce_via_ui(driver, event_date, timings=None, announce_endpoint=None):
+    """Announce the event on the current page by clicking through the UI.
+
+    Returns 'announced', 'no_banner' (usually already announced) or 'failed'.
+    """
+    timings = timings or RunTimings()
+    banner_started = time.monotonic()
+
+    # Dismiss "Become an organizer" promotional banner if present
+    try:
+        promo_banner_xpaths = [
+            "//div[contains(text(), 'Become an organizer') or contains(., 'Become an organizer')]",
+            "//div[contains(., 'Start now') and contains(., 'create an event')]",
         ]
-        
-        event_cards = None
-        for selector in selectors:
+        for xpath in promo_banner_xpaths:
+            sd_watchdog_ping()
             try:
-                logging.info(f"Trying selector: {selector}")
-                event_cards = wait.until(
-                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, selector))
-                )
-                if event_cards:
-                    logging.info(f"Found event cards with selector: {selector}")
+                promo_banner = driver.find_element(By.XPATH, xpath)
+                # Find the close button (X) in the banner
+                close_btn = promo_banner.find_element(By.XPATH, ".//*[contains(@aria-label, 'close') or contains(@aria-label, 'Close') or contains(@aria-label, 'dismiss')] | .//button[./*[name()='svg']]")
+                if close_btn.is_displayed():
+                    logging.info("Dismissing 'Become an organizer' promotional banner")
+                    close_btn.click()
+                    deadline_sleep(0.5)
                     break
-            except Exception as e:
-                logging.warning(f"Selector {selector} failed: {str(e)}")
-                continue
-        
-        if not event_cards:
-            error_msg = "No event cards found with any selector"
-            logging.error(error_msg)
-            # Since we're authenticated, this might be a website change issue
-            send_error_email(
-                f"WEBSITE STRUCTURE CHANGE: Could not find event cards on {group_url}events/. "
-                f"This might indicate that Meetup.com has changed their website structure. "
-                f"Authentication appears to be working correctly.",
-                'meetup_announcer.log',
-                'no_events_screenshot.png'
-            )
-            
-            # Take screenshot for debugging
-            try:
-                driver.save_screenshot('no_events_screenshot.png')
-                logging.info("Saved no events found screenshot")
             except:
-                logging.error("Could not save no events screenshot")
-            
-            return
-        
-        logging.info("Event cards loaded successfully")
-        
-        # Get all event URLs first to avoid stale elements
-        event_urls = []
-        for card in event_cards:
-            try:
-                event_url = card.get_attribute('href')
-                date_element = card.find_element(By.CSS_SELECTOR, 'time')
-                event_date = date_element.text
-                event_urls.append((event_url, event_date))
-            except Exception as e:
-                logging.warning(f"Could not get event details from card: {str(e)}")
                 continue
-        
-        logging.info(f"Found {len(event_urls)} events to process")
-        
-        # Process each event URL
-        for event_url, event_date in event_urls:
-            try:
-                # Check if event is within the next 18 days or in the past
-                if not is_event_within_range(event_date):
-                    logging.info(f"Found event on {event_date} - more than 18 days away. Stopping processing as events are in chronological order.")
-                    break  # Exit the loop since all subsequent events will be further in the future
-                
-                events_processed += 1
-                logging.info(f"Processing event {events_processed} on {event_date}")
-                logging.info(f"Navigating to event page: {event_url}")
-                
-                # Navigate to event page
-                driver.get(event_url)
-                time.sleep(3)  # Increased wait time for page to load
+    except Exception as e:
+        logging.debug(f"No promotional banner to dismiss: {e}")
 
-                # Check if event is cancelled - skip if so
-                if '"status":"CANCELLED"' in driver.page_source:
-                    logging.info(f"Event on {event_date} is cancelled - skipping")
-                    continue
+    # Dismiss any overlay banners that might block clicks on the Announce button
+    # Strategy: Find all banner-like elements with close buttons, dismiss any that don't contain "Let your members know"
+    try:
+        dismissible_selectors = [
+            "//div[contains(@class, 'banner')]",
+            "//div[contains(@class, 'bg-ds2')]",
+            "//div[contains(@class, 'rounded')][.//button or .//*[name()='svg']]",
+        ]
 
-                # Dismiss "Become an organizer" promotional banner if present
-                try:
-                    promo_banner_xpaths = [
-                        "//div[contains(text(), 'Become an organizer') or contains(., 'Become an organizer')]",
-                        "//div[contains(., 'Start now') and contains(., 'create an event')]",
+        for selector in dismissible_selectors:
+            sd_watchdog_ping()
+            try:
+                banners = driver.find_elements(By.XPATH, selector)
+                for banner in banners:
+                    sd_watchdog_ping()
+                    # CRITICAL: Skip the announce banner - it contains this text
+                    if 'Let your members know' in banner.text:
+                        continue
+                    if 'Announce' in banner.text and 'email announcement' in banner.text:
+                        continue
+
+                    # Try to find and click a close/dismiss button (X icon or close button)
+                    close_btn_xpaths = [
+                        ".//*[contains(@aria-label, 'close') or contains(@aria-label, 'dismiss') or contains(@aria-label, 'Close')]",
+                        ".//*[name()='svg'][@aria-hidden='true']/parent::button",
+                        ".//*[name()='svg']/parent::*[self::button or @role='button']",
+                        ".//button[contains(@class, 'close')]",
                     ]
-                    for xpath in promo_banner_xpaths:
+
+                    for close_xpath in close_btn_xpaths:
+                        sd_watchdog_ping()
                         try:
-                            promo_banner = driver.find_element(By.XPATH, xpath)
-                            # Find the close button (X) in the banner
-                            close_btn = promo_banner.find_element(By.XPATH, ".//*[contains(@aria-label, 'close') or contains(@aria-label, 'Close') or contains(@aria-label, 'dismiss')] | .//button[./*[name()='svg']]")
+                            close_btn = banner.find_element(By.XPATH, close_xpath)
                             if close_btn.is_displayed():
-                                logging.info("Dismissing 'Become an organizer' promotional banner")
+                                banner_preview = banner.text[:50].replace('\n', ' ')
+                                logging.info(f"Dismissing overlay banner: '{banner_preview}...'")
                                 close_btn.click()
-                                time.sleep(0.5)
+                                deadline_sleep(0.5)
                                 break
                         except:
                             continue
-                except Exception as e:
-                    logging.debug(f"No promotional banner to dismiss: {e}")
+            except:
+                continue
+    except Exception as e:
+        logging.debug(f"Error dismissing overlays: {e}")
 
-                # Dismiss any overlay banners that might block clicks on the Announce button
-                # Strategy: Find all banner-like elements with close buttons, dismiss any that don't contain "Let your members know"
-                try:
-                    dismissible_selectors = [
-                        "//div[contains(@class, 'banner')]",
-                        "//div[contains(@class, 'bg-ds2')]",
-                        "//div[contains(@class, 'rounded')][.//button or .//*[name()='svg']]",
-                    ]
+    # Look for the announce banner using multiple methods
+    announce_found = False
+    announce_banner = None
 
-                    for selector in dismissible_selectors:
-                        try:
-                            banners = driver.find_elements(By.XPATH, selector)
-                            for banner in banners:
-                                # CRITICAL: Skip the announce banner - it contains this text
-                                if 'Let your members know' in banner.text:
-                                    continue
-                                if 'Announce' in banner.text and 'email announcement' in banner.text:
-                                    continue
-
-                                # Try to find and click a close/dismiss button (X icon or close button)
-                                close_btn_xpaths = [
-                                    ".//*[contains(@aria-label, 'close') or contains(@aria-label, 'dismiss') or contains(@aria-label, 'Close')]",
-                                    ".//*[name()='svg'][@aria-hidden='true']/parent::button",
-                                    ".//*[name()='svg']/parent::*[self::button or @role='button']",
-                                    ".//button[contains(@class, 'close')]",
-                                ]
-
-                                for close_xpath in close_btn_xpaths:
-                                    try:
-                                        close_btn = banner.find_element(By.XPATH, close_xpath)
-                                        if close_btn.is_displayed():
-                                            banner_preview = banner.text[:50].replace('\n', ' ')
-                                            logging.info(f"Dismissing overlay banner: '{banner_preview}...'")
-                                            close_btn.click()
-                                            time.sleep(0.5)
-                                            break
-                                    except:
-                                        continue
-                        except:
-                            continue
-                except Exception as e:
-                    logging.debug(f"Error dismissing overlays: {e}")
+    # Method 1: Try XPath to find banner by "Let your members know" text
+    # Use specific selectors to avoid false positives
+    banner_xpaths = [
+        "//h4[contains(text(), 'Let your members know')]/ancestor::div[contains(@class, 'bg-ds2-banner')]",
+        "//h4[contains(text(), 'Let your members know')]/ancestor::div[contains(@class, 'rounded-ds2')]"
+    ]
 
-                # Look for the announce banner using multiple methods
+    for banner_xpath in banner_xpaths:
+        sd_watchdog_ping()
+        try:
+            logging.info(f"Looking for announce banner with XPath: {banner_xpath}")
+            announce_banner = WebDriverWait(driver, wait_timeout(5)).until(
+                EC.presence_of_element_located((By.XPATH, banner_xpath))
+            )
+            if announce_banner.is_displayed():
+                logging.info(f"Found announce banner with XPath: {banner_xpath}")
+                announce_found = True
+                break
+        except TimeoutException:
+            continue
+
+    # Method 2: Fallback to CSS selector for banner class
+    if not announce_found:
+        css_selectors = [
+            '.bg-ds2-banner-base-fill-primary-enabled',
+            '[data-testid="event-announce-banner"]'
+        ]
+        for css_selector in css_selectors:
+            sd_watchdog_ping()
+            try:
+                logging.info(f"Looking for announce banner with CSS: {css_selector}")
+                announce_banner = WebDriverWait(driver, wait_timeout(5)).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, css_selector))
+                )
+                if announce_banner.is_displayed():
+                    logging.info(f"Found announce banner with CSS: {css_selector}")
+                    announce_found = True
+                    break
+            except TimeoutException:
+                continue
+
+    # Verify the banner is actually an announce banner (not a false positive)
+    if announce_found and announce_banner:
+        try:
+            banner_text = announce_banner.text
+            if 'Let your members know' not in banner_text:
+                logging.info(f"Banner found but doesn't contain expected text, treating as no banner")
                 announce_found = False
                 announce_banner = None
+        except Exception as e:
+            logging.warning(f"Could not verify banner text: {e}")
 
-                # Method 1: Try XPath to find banner by "Let your members know" text
-                # Use specific selectors to avoid false positives
-                banner_xpaths = [
-                    "//h4[contains(text(), 'Let your members know')]/ancestor::div[contains(@class, 'bg-ds2-banner')]",
-                    "//h4[contains(text(), 'Let your members know')]/ancestor::div[contains(@class, 'rounded-ds2')]"
-                ]
+    timings.record('event_banner', time.monotonic() - banner_started)
 
-                for banner_xpath in banner_xpaths:
-                    try:
-                        logging.info(f"Looking for announce banner with XPath: {banner_xpath}")
-                        announce_banner = WebDriverWait(driver, 5).until(
-                            EC.presence_of_element_located((By.XPATH, banner_xpath))
-                        )
-                        if announce_banner.is_displayed():
-                            logging.info(f"Found announce banner with XPath: {banner_xpath}")
-                            announce_found = True
-                            break
-                    except TimeoutException:
-                        continue
+    if announce_found and announce_banner:
+        with timings.phase('event_click'):
+            # Find and click the Announce button with retry logic for stale elements
+            button_clicked = False
+            max_retries = 2
+
+            # Wait for button to render after banner is found
+            deadline_sleep(2)
 
-                # Method 2: Fallback to CSS selector for banner class
-                if not announce_found:
-                    css_selectors = [
-                        '.bg-ds2-banner-base-fill-primary-enabled',
-                        '[data-testid="event-announce-banner"]'
+            for retry_attempt in range(max_retries):
+                sd_watchdog_ping()
+                if button_clicked:
+                    break
+
+                try:
+                    # Try XPath to find button with "Announce" text
+                    # Added ".//button" as last fallback to find any button in banner
+                    button_xpaths = [
+                        ".//button[.//span[contains(text(), 'Announce')]]",
+                        ".//button[contains(., 'Announce')]",
+                        "//button[.//span[contains(text(), 'Announce')]]",
+                        ".//button[@type='button']",
+                        ".//button"
                     ]
-                    for css_selector in css_selectors:
+
+                    for button_xpath in button_xpaths:
+                        sd_watchdog_ping()
                         try:
-                            logging.info(f"Looking for announce banner with CSS: {css_selector}")
-                            announce_banner = WebDriverWait(driver, 5).until(
-                                EC.presence_of_element_located((By.CSS_SELECTOR, css_selector))
-                            )
-                            if announce_banner.is_displayed():
-                                logging.info(f"Found announce banner with CSS: {css_selector}")
-                                announce_found = True
+                            logging.info(f"Looking for Announce button with XPath: {button_xpath}")
+                            if button_xpath.startswith('.'):
+                                # Use WebDriverWait with shorter timeout per XPath attempt
+                                announce_button = WebDriverWait(driver, wait_timeout(5)).until(
+                                    lambda d: announce_banner.find_element(By.XPATH, button_xpath)
+                                )
+                            else:
+                                announce_button = WebDriverWait(driver, wait_timeout(5)).until(
+                                    EC.presence_of_element_located((By.XPATH, button_xpath))
+                                )
+
+                            if announce_button.is_displayed() and announce_button.is_enabled():
+                                logging.info(f"Found clickable Announce button")
+                                logging.info(f"Clicking announce button for event on {event_date}")
+
+                                # Scroll into view first to ensure button is visible
+                                driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", announce_button)
+                                deadline_sleep(0.3)
+
+                                # Another worker may have taken the group over while this page loaded
+                                check_work_lease()
+
+                                # Try regular click first, fall back to JS click if intercepted
+                                try:
+                                    announce_button.click()
+                                except Exception as click_error:
+                                    logging.info(f"Regular click failed ({click_error}), using JS click")
+                                    driver.execute_script("arguments[0].click();", announce_button)
+
+                                button_clicked = True
+                                confirmation = None
+                                if network_confirmation_enabled:
+                                    confirmation = wait_for_announce_response(driver, announce_endpoint)
+                                if confirmation is None:
+                                    # No performance log (or replaying) - fall back to waiting for a dialog
+                                    deadline_sleep(3)  # Wait for any popups or confirmations
+
+                                    # Handle any confirmation dialogs
+                                    try:
+                                        confirm_button = WebDriverWait(driver, wait_timeout(5)).until(
+                                            EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Confirm') or contains(., 'Send') or contains(., 'Yes')]"))
+                                        )
+                                        confirm_button.click()
+                                        logging.info("Clicked confirmation button")
+                                    except TimeoutException:
+                                        logging.info("No confirmation dialog found")
+                                elif confirmation == 'failed':
+                                    return 'failed'
+
+                                logging.info(f"Event on {event_date} announced successfully!")
                                 break
+                            else:
+                                logging.info(f"Button found but not clickable")
+                        except StaleElementReferenceException:
+                            raise  # Re-raise to trigger retry
+                        except LeaseLost:
+                            raise
                         except TimeoutException:
+                            logging.warning(f"Button XPath {button_xpath} timed out")
+                            continue
+                        except Exception as e:
+                            logging.warning(f"Button XPath {button_xpath} failed: {str(e)}")
                             continue
 
-                # Verify the banner is actually an announce banner (not a false positive)
-                if announce_found and announce_banner:
+                except StaleElementReferenceException:
+                    logging.warning(f"Stale element reference, retry {retry_attempt + 1}/{max_retries}")
+                    deadline_sleep(1)
+                    # Re-find the announce banner before retrying
                     try:
-                        banner_text = announce_banner.text
-                        if 'Let your members know' not in banner_text:
-                            logging.info(f"Banner found but doesn't contain expected text, treating as no banner")
-                            announce_found = False
-                            announce_banner = None
-                    except Exception as e:
-                        logging.warning(f"Could not verify banner text: {e}")
-
-                if announce_found and announce_banner:
-                    # Find and click the Announce button with retry logic for stale elements
-                    button_clicked = False
-                    max_retries = 2
-
-                    # Wait for button to render after banner is found
-                    time.sleep(2)
-
-                    for retry_attempt in range(max_retries):
-                        if button_clicked:
-                            break
+                        announce_banner = driver.find_element(By.XPATH, "//h4[contains(text(), 'Let your members know')]/ancestor::div[contains(@class, 'bg-ds2-banner')]")
+                    except:
+                        pass
+                    continue
 
-                        try:
-                            # Try XPath to find button with "Announce" text
-                            # Added ".//button" as last fallback to find any button in banner
-                            button_xpaths = [
-                                ".//button[.//span[contains(text(), 'Announce')]]",
-                                ".//button[contains(., 'Announce')]",
-                                "//button[.//span[contains(text(), 'Announce')]]",
-                                ".//button[@type='button']",
-                                ".//button"
-                            ]
-
-                            for button_xpath in button_xpaths:
-                                try:
-                                    logging.info(f"Looking for Announce button with XPath: {button_xpath}")
-                                    if button_xpath.startswith('.'):
-                                        # Use WebDriverWait with shorter timeout per XPath attempt
-                                        announce_button = WebDriverWait(driver, 5).until(
-                                            lambda d: announce_banner.find_element(By.XPATH, button_xpath)
-                                        )
-                                    else:
-                                        announce_button = WebDriverWait(driver, 5).until(
-                                            EC.presence_of_element_located((By.XPATH, button_xpath))
-                                        )
+            if not button_clicked:
+                outcome = announce_failed("Found announce banner but could not click the Announce button")
+                # Log banner HTML for debugging
+                try:
+                    banner_html = announce_banner.get_attribute('outerHTML')
+                    if banner_html:
+                        logging.warning(f"Banner HTML preview (first 1000 chars): {banner_html[:1000]}")
+                except Exception as html_err:
+                    logging.warning(f"Could not get banner HTML: {html_err}")
+                return outcome
+            return 'announced'
+    else:
+        logging.info(f"No announce banner found for event on {event_date} - event may already be announced")
+        # Take a screenshot for debugging (but don't send email - this is normal)
+        try:
+            screenshot_path = run_file(f'no_banner_screenshot_{event_date.replace("/", "_").replace(" ", "_")}.png')
+            driver.save_screenshot(screenshot_path)
+            logging.info(f"Saved screenshot to {screenshot_path}")
+        except Exception as e:
+            logging.warning(f"Could not save screenshot: {str(e)}")
+        return 'no_banner'
 
-                                    if announce_button.is_displayed() and announce_button.is_enabled():
-                                        logging.info(f"Found clickable Announce button")
-                                        logging.info(f"Clicking announce button for event on {event_date}")
-
-                                        # Scroll into view first to ensure button is visible
-                                        driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", announce_button)
-                                        time.sleep(0.3)
-
-                                        # Try regular click first, fall back to JS click if intercepted
-                                        try:
-                                            announce_button.click()
-                                        except Exception as click_error:
-                                            logging.info(f"Regular click failed ({click_error}), using JS click")
-                                            driver.execute_script("arguments[0].click();", announce_button)
-
-                                        button_clicked = True
-                                        time.sleep(3)  # Wait for any popups or confirmations
-
-                                        # Handle any confirmation dialogs
-                                        try:
-                                            confirm_button = WebDriverWait(driver, 5).until(
-                                                EC.element_to_be_clickable((By.XPATH, "//button[contains(., 'Confirm') or contains(., 'Send') or contains(., 'Yes')]"))
-                                            )
-                                            confirm_button.click()
-                                            logging.info("Clicked confirmation button")
-                                        except TimeoutException:
-                                            logging.info("No confirmation dialog found")
-
-                                        events_announced += 1
-                                        logging.info(f"Event on {event_date} announced successfully!")
-                                        break
-                                    else:
-                                        logging.info(f"Button found but not clickable")
-                                except StaleElementReferenceException:
-                                    raise  # Re-raise to trigger retry
-                                except TimeoutException:
-                                    logging.warning(f"Button XPath {button_xpath} timed out")
-                                    continue
-                                except Exception as e:
-                                    logging.warning(f"Button XPath {button_xpath} failed: {str(e)}")
-                                    continue
+# GraphQL endpoint and mutation the event page's Announce button sends
+ANNOUNCE_API_URL = 'https://www.meetup.com/gql2'
+ANNOUNCE_MUTATION = """
+mutation announceEvent($input: AnnounceEventInput!) {
+  announceEvent(input: $input) {
+    event {
+      id
+      isAnnounced
+    }
+    errors {
+      code
+      message
+    }
+  }
+}
+"""
+CSRF_COOKIE_NAMES = ['MEETUP_CSRF', 'XSRF-TOKEN', 'csrf-token']
+CSRF_META_SCRIPT = """
+var meta = document.querySelector('meta[name="csrf-token"], meta[name="csrf_token"]');
+return meta ? meta.getAttribute('content') : null;
+"""
 
-                        except StaleElementReferenceException:
-                            logging.warning(f"Stale element reference, retry {retry_attempt + 1}/{max_retries}")
-                            time.sleep(1)
-                            # Re-find the announce banner before retrying
-                            try:
-                                announce_banner = driver.find_element(By.XPATH, "//h4[contains(text(), 'Let your members know')]/ancestor::div[contains(@class, 'bg-ds2-banner')]")
-                            except:
-                                pass
-                            continue
+def create_http_session(pool_size=4):
+    """Create a pooled HTTP client that is reused for every API call in a run."""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=1)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({
+        'User-Agent': USER_AGENT,
+        'Accept': 'application/json',
+        'Content-Type': 'application/json',
+        'Origin': 'https://www.meetup.com'
+    })
+    return session
 
-                    if not button_clicked:
-                        logging.warning(f"Found announce banner but could not click button for event on {event_date}")
-                        # Log banner HTML for debugging
-                        try:
-                            banner_html = announce_banner.get_attribute('outerHTML')
-                            if banner_html:
-                                logging.warning(f"Banner HTML preview (first 1000 chars): {banner_html[:1000]}")
-                        except Exception as html_err:
-                            logging.warning(f"Could not get banner HTML: {html_err}")
-                        events_failed_to_announce += 1
-                        failed_events.append(f"{event_date}: Found banner but button not clickable")
+def get_browser_credentials(driver):
+    """Return (cookie_header, csrf_token) taken from the browser's logged-in session."""
+    cookies = driver.get_cookies()
+    cookie_header = '; '.join(f"{cookie['name']}={cookie['value']}" for cookie in cookies)
+
+    csrf_token = None
+    for cookie in cookies:
+        if cookie['name'] in CSRF_COOKIE_NAMES:
+            csrf_token = cookie['value']
+            break
+    if not csrf_token:
+        try:
+            csrf_token = driver.execute_script(CSRF_META_SCRIPT)
+        except Exception as e:
+            logging.warning(f"Could not read CSRF token from page: {str(e)}")
+
+    return cookie_header, csrf_token
+
+def check_announce_response(body):
+    """Check a parsed announceEvent response. Returns None if it confirms the announce, else the problem."""
+    if body.get('errors'):
+        return f"Announce request returned errors: {body['errors']}"
+
+    result = (body.get('data') or {}).get('announceEvent') or {}
+    if result.get('errors'):
+        return f"Announce was rejected: {result['errors']}"
+
+    event = result.get('event') or {}
+    if not event.get('isAnnounced'):
+        return f"Announce response did not confirm the event is announced: {body}"
+    return None
+
+def announce_via_http(driver, session, event_id, endpoint=ANNOUNCE_API_URL):
+    """Announce an event by sending the Announce button's mutation directly.
+
+    Returns 'announced' only if the server confirms the event is announced,
+    'not_sent' if the mutation certainly didn't run (nothing sent, connection
+    refused, 4xx), and 'unknown' when it may have run (timeouts, 5xx, a 200
+    that doesn't confirm the announce).
+    """
+    if not event_id:
+        logging.warning("No event id available - cannot use HTTP announce")
+        return 'not_sent'
+
+    cookie_header, csrf_token = get_browser_credentials(driver)
+    if not cookie_header:
+        logging.warning("Browser has no cookies - cannot use HTTP announce")
+        return 'not_sent'
+
+    headers = {
+        'Cookie': cookie_header,
+        'Referer': driver.current_url
+    }
+    if csrf_token:
+        headers['X-CSRF-Token'] = csrf_token
+    else:
+        logging.warning("No CSRF token found - sending announce request without one")
+
+    payload = {
+        'operationName': 'announceEvent',
+        'query': ANNOUNCE_MUTATION,
+        'variables': {'input': {'eventId': event_id}}
+    }
+
+    try:
+        logging.info(f"Sending announce request for event {event_id} to {endpoint}")
+        get_request_governor().acquire(endpoint)
+        response = session.post(endpoint, json=payload, headers=headers, timeout=15)
+    except requests.ConnectTimeout as e:
+        logging.warning(f"Announce request could not connect: {str(e)}")
+        return 'not_sent'
+    except requests.ConnectionError as e:
+        # Refused or unresolvable means nothing reached the server; anything else (e.g. a reset
+        # connection) may have dropped after the request was sent
+        reason = getattr(e.args[0], 'reason', None) if e.args else None
+        if isinstance(reason, NewConnectionError):
+            logging.warning(f"Announce request could not connect: {str(e)}")
+            return 'not_sent'
+        logging.warning(f"Announce request failed, it may still have gone through: {str(e)}")
+        return 'unknown'
+    except requests.RequestException as e:
+        logging.warning(f"Announce request failed, it may still have gone through: {str(e)}")
+        return 'unknown'
+
+    retry_after = response.headers.get('Retry-After')
+    get_request_governor().report(endpoint, throttled=response.status_code == 429,
+                                  retry_after=float(retry_after) if retry_after and retry_after.isdigit() else None)
+
+    if 400 <= response.status_code < 500:
+        logging.warning(f"Announce request was refused with HTTP {response.status_code}: {response.text[:500]}")
+        return 'not_sent'
+    if response.status_code != 200:
+        logging.warning(f"Announce request returned HTTP {response.status_code}: {response.text[:500]}")
+        return 'unknown'
+
+    try:
+        body = response.json()
+    except ValueError:
+        logging.warning(f"Announce response is not JSON: {response.text[:500]}")
+        return 'unknown'
+
+    error = check_announce_response(body)
+    if error:
+        logging.warning(error)
+        return 'unknown'
+
+    logging.info(f"Server confirmed event {event_id} is announced")
+    return 'announced'
+
+# Selectors for the event cards on a group's events page, most specific first
+EVENT_CARD_SELECTORS = [
+    'a[id^="event-card-e-"]',
+    'a[data-event-label^="event-card-"]',
+    'a[href*="/events/"]'
+]
+
+def find_event_cards(driver, group_url):
+    """Load the group's events page and return the event card elements (or None)."""
+    events_url = f"{group_url}events/"
+    logging.info(f"Attempting to navigate to: {events_url}")
+
+    # Add retry logic for page load
+    max_retries = 3
+    for attempt in range(max_retries):
+        sd_watchdog_ping()
+        try:
+            governed_get(driver, events_url)
+            logging.info(f"Successfully navigated to events page: {events_url}")
+            break
+        except DeadlineExceeded:
+            raise
+        except Exception as e:
+            if attempt == max_retries - 1 or out_of_time():
+                raise
+            logging.warning(f"Attempt {attempt + 1} failed to load page: {str(e)}")
+            deadline_sleep(5)  # Wait before retrying
+
+    # Wait for event cards with increased timeout
+    logging.info("Waiting for event cards to load...")
+    wait = WebDriverWait(driver, wait_timeout(30))  # Increase timeout to 30 seconds
+
+    # Try multiple selectors with increased timeouts
+    event_cards = None
+    for selector in EVENT_CARD_SELECTORS:
+        sd_watchdog_ping()
+        try:
+            logging.info(f"Trying selector: {selector}")
+            event_cards = wait.until(
+                EC.presence_of_all_elements_located((By.CSS_SELECTOR, selector))
+            )
+            if event_cards:
+                logging.info(f"Found event cards with selector: {selector}")
+                record_page(driver, events_url)
+                break
+        except Exception as e:
+            logging.warning(f"Selector {selector} failed: {str(e)}")
+            continue
+    
+    return event_cards
+
+CARD_RECORD_JS = """
+function cardRecord(card) {
+    var time = card.querySelector('time');
+    var text = (card.innerText || '').toLowerCase();
+    var cancelled = text.indexOf('cancelled') !== -1 || text.indexOf('canceled') !== -1;
+    return {
+        url: card.href || card.getAttribute('href'),
+        date: time ? time.innerText : null,
+        status: cancelled ? 'CANCELLED' : 'ACTIVE'
+    };
+}
+"""
+
+# Reads url, date text and cancelled status from every card in one round trip
+CARD_RECORDS_SCRIPT = CARD_RECORD_JS + """
+return arguments[0].map(cardRecord);
+"""
+
+# Finds the cards with the first selector that matches and reads them, without any element handles
+LISTING_RECORDS_SCRIPT = CARD_RECORD_JS + """
+var selectors = arguments[0];
+for (var i = 0; i < selectors.length; i++) {
+    var cards = Array.prototype.slice.call(document.querySelectorAll(selectors[i]));
+    if (cards.length) {
+        return cards.map(cardRecord);
+    }
+}
+return null;
+"""
+
+def read_event_cards(driver, event_cards):
+    """Return a record (url, date, status) for each event card that has a date."""
+    try:
+        records = driver.execute_script(CARD_RECORDS_SCRIPT, event_cards)
+    except Exception as e:
+        logging.warning(f"Could not read event cards in one pass, reading them one by one: {str(e)}")
+        records = []
+        for card in event_cards:
+            try:
+                records.append({
+                    'url': card.get_attribute('href'),
+                    'date': card.find_element(By.CSS_SELECTOR, 'time').text,
+                    'status': 'CANCELLED' if re.search(r'cancell?ed', card.text.lower()) else 'ACTIVE'
+                })
+            except Exception as e:
+                logging.warning(f"Could not get event details from card: {str(e)}")
+                continue
+
+    dated_records = [record for record in records if record.get('url') and record.get('date')]
+    if len(dated_records) < len(records):
+        logging.warning(f"Skipped {len(records) - len(dated_records)} event cards without a date")
+    return dated_records
+
+def listing_fingerprint(records):
+    """Hash of the listing's event ids, dates and statuses, independent of card order."""
+    entries = sorted((extract_event_id(record['url']) or record['url'], record['date'], record['status'])
+                     for record in records)
+    return hashlib.sha256(json.dumps(entries).encode('utf-8')).hexdigest()
+
+def process_event(driver, event_url, event_date, http_session=None, announce_endpoint=ANNOUNCE_API_URL, timings=None):
+    """Open an event page and announce it if it still needs announcing.
+
+    Returns 'announced', 'already_announced', 'cancelled', 'no_banner' or 'failed'.
+    The page's network activity is captured when it fails or is slow. Why an
+    event failed is left in last_failure_reason.
+    """
+    global last_failure_reason
+    last_failure_reason = None
+    if network_recorder is None:
+        # Nothing to capture, but start the page with an empty performance log
+        drain_performance_log(driver)
+        return visit_event(driver, event_url, event_date, http_session, announce_endpoint, timings)
+
+    network_recorder.start(driver)
+    outcome = 'error'
+    try:
+        outcome = visit_event(driver, event_url, event_date, http_session, announce_endpoint, timings)
+        return outcome
+    finally:
+        network_recorder.finish(driver, extract_event_id(event_url) or event_date, failed=outcome in ('failed', 'error'))
+
+def visit_event(driver, event_url, event_date, http_session=None, announce_endpoint=ANNOUNCE_API_URL, timings=None):
+    """Do the work of process_event on the event page."""
+    timings = timings or RunTimings()
+    logging.info(f"Navigating to event page: {event_url}")
+
+    with timings.phase('event_navigate'):
+        # Navigate to event page
+        governed_get(driver, event_url)
+        deadline_sleep(3)  # Increased wait time for page to load
+        record_page(driver, event_url)
+
+        # Read the event's embedded state instead of pulling the whole page source
+        event_state = get_event_state(driver, event_url)
+
+    # Check if event is cancelled - skip if so
+    if event_state and event_state.status == 'CANCELLED':
+        logging.info(f"Event on {event_date} is cancelled - skipping")
+        return 'cancelled'
+
+    # Already announced according to the page state - no need to look for the banner
+    if event_state and event_state.is_announced:
+        logging.info(f"Event on {event_date} is already announced - skipping")
+        return 'already_announced'
+
+    outcome = None
+    if http_session:
+        with timings.phase('event_announce_http'):
+            event_id = (event_state and event_state.event_id) or extract_event_id(event_url)
+            check_work_lease()
+            http_result = announce_via_http(driver, http_session, event_id, announce_endpoint)
+            if http_result == 'announced':
+                outcome = 'announced'
+                logging.info(f"Event on {event_date} announced successfully via HTTP!")
+            elif http_result == 'unknown':
+                # The server may have announced already - clicking Announce on the stale page would
+                # send members a second email, so look at the event's current state instead
+                logging.info("HTTP announce result unknown - reloading the event page to check")
+                governed_get(driver, event_url)
+                deadline_sleep(3)
+                event_state = get_event_state(driver, event_url)
+                if event_state and event_state.is_announced:
+                    outcome = 'announced'
+                    logging.info(f"Event on {event_date} turned out to be announced")
                 else:
-                    logging.info(f"No announce banner found for event on {event_date} - event may already be announced")
-                    # Take a screenshot for debugging (but don't send email - this is normal)
-                    try:
-                        screenshot_path = f'no_banner_screenshot_{event_date.replace("/", "_").replace(" ", "_")}.png'
-                        driver.save_screenshot(screenshot_path)
-                        logging.info(f"Saved screenshot to {screenshot_path}")
-                    except Exception as e:
-                        logging.warning(f"Could not save screenshot: {str(e)}")
+                    outcome = announce_failed("HTTP announce could not be confirmed and the reloaded page doesn't show "
+                                              "the event as announced - not retried through the UI in case the "
+                                              "announce is still going through")
+            else:
+                logging.info("HTTP announce was not sent - falling back to the UI")
+
+    if outcome is None:
+        with timings.phase('event_announce_ui'):
+            outcome = announce_via_ui(driver, event_date, timings, announce_endpoint)
+    return outcome
+
+# Even when the deadline is tight, each event gets at least this long
+MIN_EVENT_BUDGET_SECONDS = 20
+
+def event_start_sort_key(event):
+    """Sort key putting the events that start soonest first; undated events go last."""
+    try:
+        start = parse_event_date(event[1])
+        if not start.tzinfo:
+            start = pytz.UTC.localize(start)
+        return (0, start.timestamp())
+    except Exception:
+        return (1, 0)
+
+def report_skipped_groups(skipped_groups):
+    """Log and email the groups the run deadline stopped before their events could be processed.
+
+    skipped_groups holds (group url, reason) pairs.
+    """
+    if not skipped_groups:
+        return
+    logging.warning(f"Groups skipped because the run deadline was reached: {len(skipped_groups)}")
+    for group_url, reason in skipped_groups:
+        logging.warning(f"  Skipped: {group_url} ({reason})")
+    send_error_email(
+        f"DEADLINE REACHED: {len(skipped_groups)} groups were not processed because the run ran out of time:\n\n"
+        + "\n".join(f"{group_url}: {reason}" for group_url, reason in skipped_groups),
+        run_file('meetup_announcer.log'),
+        None
+    )
+
+def announce_events(driver, group_url, announce_backend='ui', announce_endpoint=ANNOUNCE_API_URL, heartbeat=None,
+                    schedule=None, watchdog=None, timings=None, last_run=None):
+    """Navigate to events page and announce events.
+
+    heartbeat, if given, is called before each event is processed. With a
+    schedule, only events that have newly become eligible are visited and
+    the listing is only reloaded when its refresh is due. A MemoryWatchdog
+    may swap the driver between events; callers should use watchdog.driver
+    afterwards. Phase durations are added to timings when it is given. With
+    last_run, the run stops right after the listing if nothing has changed
+    since a run that finished every event. Raises DeadlineExceeded when the
+    run deadline runs out during authentication or the listing.
+    """
+    timings = timings or RunTimings()
+    fingerprint = None
+    if run_deadline:
+        run_deadline.start_group()
+    http_session = create_http_session() if announce_backend == 'http' else None
+    events_processed = 0
+    events_announced = 0
+    events_failed_to_announce = 0
+    failed_events = []
+    duplicate_links = 0
+    non_event_links = 0
+    
+    try:
+        # First, check if we're authenticated
+        sd_watchdog_ping(f"{group_url}: checking authentication")
+        with timings.phase('auth'), deadline_phase('auth'):
+            apply_deadline_to_driver(driver)
+            authenticated = check_authentication(driver, group_url)
+            if not authenticated:
+                raise_if_out_of_time('the authentication check')
+        if not authenticated:
+            error_message = ("AUTHENTICATION ISSUE: The script is not logged in to Meetup.com. "
+                           "This is likely why no announce buttons are being found. "
+                           "Please run the script with --manual-login to authenticate:\n\n"
+                           "ssh -Y almalinux\n"
+                           "cd /var/www/meetup_automation\n"
+                           "source venv/bin/activate\n"
+                           "python meetup_announcer.py --manual-login --group-url \"https://www.meetup.com/joyful-parenting-sf/\"\n\n"
+                           "Then log in through the browser window that appears.")
+            
+            logging.error("Authentication check failed - not logged in")
+            if schedule:
+                schedule.record_failed_attempt(group_url)
+            
+            # Take screenshot for debugging
+            try:
+                driver.save_screenshot(run_file('authentication_error_screenshot.png'))
+                logging.info("Saved authentication error screenshot")
+            except:
+                logging.error("Could not save authentication error screenshot")
+            
+            send_daily_email(
+                'logged_out',
+                error_message,
+                run_file('meetup_announcer.log'),
+                run_file('authentication_error_screenshot.png')
+            )
+            return
+        
+        logging.info("Authentication check passed - user appears to be logged in")
+        
+        # Check organizer permissions
+        with timings.phase('permissions'), deadline_phase('auth'):
+            is_organizer = check_organizer_permissions(driver, group_url)
+            if not is_organizer:
+                raise_if_out_of_time('the organizer permissions check')
+        if not is_organizer:
+            error_message = ("ORGANIZER PERMISSIONS ISSUE: The logged-in user does not appear to have "
+                           "organizer permissions for this Meetup group. Only organizers can announce events. "
+                           "Please verify that the logged-in account has organizer access to the group.")
+            
+            logging.error("Organizer permissions check failed")
+            if schedule:
+                schedule.record_failed_attempt(group_url)
+            
+            # Take screenshot for debugging
+            try:
+                driver.save_screenshot(run_file('permissions_error_screenshot.png'))
+                logging.info("Saved permissions error screenshot")
+            except:
+                logging.error("Could not save permissions error screenshot")
+            
+            send_daily_email(
+                'not_organizer',
+                error_message,
+                run_file('meetup_announcer.log'),
+                run_file('permissions_error_screenshot.png')
+            )
+            return
+        
+        logging.info("Organizer permissions check passed")
+        if schedule:
+            schedule.clear_failed_attempts(group_url)
+        
+        if schedule and not schedule.listing_due(group_url):
+            # The listing is still fresh - only visit events that have become eligible since
+            event_urls = schedule.due_events(group_url)
+            logging.info(f"Listing refresh not due - visiting {len(event_urls)} newly eligible events from the schedule")
+        else:
+            sd_watchdog_ping(f"{group_url}: loading events listing")
+            with timings.phase('listing'), deadline_phase('listing'):
+                apply_deadline_to_driver(driver)
+                event_cards = find_event_cards(driver, group_url)
+                if not event_cards:
+                    raise_if_out_of_time('loading the events listing')
+        
+            if not event_cards:
+                error_msg = "No event cards found with any selector"
+                logging.error(error_msg)
+                if schedule:
+                    schedule.record_failed_attempt(group_url)
+                # Since we're authenticated, this might be a website change issue
+                send_error_email(
+                    f"WEBSITE STRUCTURE CHANGE: Could not find event cards on {group_url}events/. "
+                    f"This might indicate that Meetup.com has changed their website structure. "
+                    f"Authentication appears to be working correctly.",
+                    run_file('meetup_announcer.log'),
+                    run_file('no_events_screenshot.png')
+                )
+            
+                # Take screenshot for debugging
+                try:
+                    driver.save_screenshot(run_file('no_events_screenshot.png'))
+                    logging.info("Saved no events found screenshot")
+                except:
+                    logging.error("Could not save no events screenshot")
+            
+                return
+        
+            logging.info("Event cards loaded successfully")
+        
+            # Get all event URLs first to avoid stale elements
+            records = read_event_cards(driver, event_cards)
+            event_urls, duplicate_links, non_event_links = index_event_urls(
+                (record['url'], record['date']) for record in records
+            )
+            if duplicate_links or non_event_links:
+                logging.info(f"Dropped {duplicate_links} duplicate and {non_event_links} non-event links from the listing")
+            fingerprint = listing_fingerprint(records)
+        
+            if schedule:
+                schedule.record_listing(group_url, event_urls)
+                event_urls = schedule.events_to_visit(group_url, event_urls)
+        
+        logging.info(f"Found {len(event_urls)} events to process")
+        
+        # Check if each event is within the next 18 days or in the past
+        events_in_window = []
+        for event_url, event_date in event_urls:
+            if not is_event_within_range(event_date):
+                logging.info(f"Found event on {event_date} - more than 18 days away. Stopping processing as events are in chronological order.")
+                break  # All subsequent events will be further in the future
+            events_in_window.append((event_url, event_date))
+        
+        # Handle the events nearest to their start date first, in case time runs out
+        events_in_window.sort(key=event_start_sort_key)
+        
+        # Nothing changed since a run that finished every event - no need to visit any event page
+        if last_run and fingerprint and last_run.is_unchanged(group_url, fingerprint, events_in_window):
+            logging.info(f"NO WORK: events listing unchanged and no new events in the {ANNOUNCE_WINDOW_DAYS}-day window "
+                         f"since the last run (fingerprint {fingerprint[:12]}) - finished in {timings.total():.2f}s")
+            timings.log_summary()
+            return
+        
+        event_outcomes = {}
+        skipped_events = []
+        
+        # Process each event URL
+        for index, (event_url, event_date) in enumerate(events_in_window):
+            if run_deadline and run_deadline.expired():
+                skipped_events.extend(events_in_window[index:])
+                logging.warning(f"Run deadline reached - skipping {len(events_in_window) - index} remaining events")
+                break
+            sd_watchdog_ping(f"{group_url}: event {index + 1}/{len(events_in_window)} on {event_date} "
+                             f"({events_announced} announced, {events_failed_to_announce} failed)")
+            if heartbeat:
+                heartbeat()
+            if watchdog:
+                driver = watchdog.check(driver)
+            try:
+                events_processed += 1
+                logging.info(f"Processing event {events_processed} on {event_date}")
+                # Split what's left evenly over the remaining events, but give each one a fair chance
+                event_budget = None
+                if run_deadline:
+                    event_budget = max(MIN_EVENT_BUDGET_SECONDS,
+                                       run_deadline.remaining_total() / (len(events_in_window) - index))
+                with timings.phase('event'), deadline_phase('event', event_budget):
+                    apply_deadline_to_driver(driver)
+                    outcome = process_event(driver, event_url, event_date, http_session, announce_endpoint, timings)
+                event_outcomes[event_url] = outcome
+                if schedule:
+                    schedule.record_outcome(group_url, event_url, outcome)
+                if outcome == 'announced':
+                    events_announced += 1
+                elif outcome == 'failed':
+                    events_failed_to_announce += 1
+                    failed_events.append(f"{event_date}: {last_failure_reason or 'announce failed'}")
                 
+            except LeaseLost:
+                raise
+            except DeadlineExceeded as e:
+                # Out of time for this event before it could be tried - report it as skipped, not failed
+                events_processed -= 1
+                logging.warning(f"{str(e)} - skipping the event on {event_date}")
+                skipped_events.append((event_url, event_date))
+                continue
             except Exception as e:
                 events_failed_to_announce += 1
                 error_traceback = traceback.format_exc()
                 error_msg = f"Error processing event on {event_date}: {str(e)}\nTraceback:\n{error_traceback}"
                 logging.error(error_msg)
                 failed_events.append(f"{event_date}: {str(e)}")
+                event_outcomes[event_url] = 'error'
+                if schedule:
+                    schedule.record_outcome(group_url, event_url, 'error')
                 
                 # Take a screenshot for debugging
                 try:
-                    driver.save_screenshot('error_screenshot.png')
+                    driver.save_screenshot(run_file('error_screenshot.png'))
                     logging.info("Saved error screenshot to error_screenshot.png")
                 except:
                     logging.error("Could not save error screenshot")
                 continue
         
+        if http_session:
+            http_session.close()
+
+        if last_run and fingerprint:
+            last_run.save_run(group_url, fingerprint, events_in_window, event_outcomes)
+
+        sd_watchdog_ping(f"{group_url}: done - {events_processed} processed, {events_announced} announced, "
+                         f"{events_failed_to_announce} failed, {len(skipped_events)} skipped")
+
         # Summary logging
         logging.info(f"=== PROCESSING COMPLETE ===")
         logging.info(f"Events processed: {events_processed}")
         logging.info(f"Events announced: {events_announced}")
         logging.info(f"Events failed to announce: {events_failed_to_announce}")
+        logging.info(f"Duplicate event links skipped: {duplicate_links}")
+        logging.info(f"Non-event links ignored: {non_event_links}")
+        if skipped_events:
+            logging.warning(f"Events skipped because the run deadline was reached: {len(skipped_events)}")
+            for event_url, event_date in skipped_events:
+                logging.warning(f"  Skipped: {event_date} ({event_url})")
+        if watchdog:
+            watchdog.sample()
+            logging.info(watchdog.summary())
+        timings.log_summary()
+        logging.info(get_request_governor().summary())
         
         # Send email notification only for actual failures (not when events are already announced)
-        if events_failed_to_announce > 0:
-            error_message = f"ANNOUNCE FAILURES: Failed to announce {events_failed_to_announce} out of {events_processed} events:\n\n" + "\n".join(failed_events)
-            error_message += f"\n\nNote: Events without announce banners are typically already announced and don't require action."
+        if events_failed_to_announce > 0 or skipped_events:
+            error_message = ""
+            if events_failed_to_announce > 0:
+                error_message += f"ANNOUNCE FAILURES: Failed to announce {events_failed_to_announce} out of {events_processed} events:\n\n" + "\n".join(failed_events)
+                error_message += f"\n\nNote: Events without announce banners are typically already announced and don't require action."
+            if skipped_events:
+                error_message += (f"\n\nDEADLINE REACHED: {len(skipped_events)} events were not processed because the "
+                                  f"run ran out of time:\n\n" + "\n".join(event_date for _, event_date in skipped_events))
             
             logging.warning("Sending email notification about failed announces")
             send_error_email(
                 error_message,
-                'meetup_announcer.log',
-                'error_screenshot.png'
+                run_file('meetup_announcer.log'),
+                run_file('error_screenshot.png'),
+                network_recorder.dumped if network_recorder else None
             )
         elif events_announced > 0:
             logging.info(f"SUCCESS: Announced {events_announced} events - no notification needed")
         else:
             logging.info("NO ACTION NEEDED: No events required announcing - all events may already be announced")
             
+    except DeadlineExceeded:
+        # Ran out of time during authentication or the listing - the caller reports the group as skipped
+        raise
     except Exception as e:
         error_traceback = traceback.format_exc() 
         logging.error(f"Error during event announcement: {str(e)}\nTraceback:\n{error_traceback}")
         # Take a screenshot for debugging
         try:
-            driver.save_screenshot('error_screenshot.png')
+            driver.save_screenshot(run_file('error_screenshot.png'))
             logging.info("Saved error screenshot to error_screenshot.png")
         except:
             logging.error("Could not save error screenshot")
         raise
 
+# Outcomes that mean the event never needs to be visited again
+FINAL_OUTCOMES = ('announced', 'already_announced', 'no_banner', 'cancelled')
+
+class LastRunState:
+    """Fingerprint of each group's events listing plus the per-event outcomes of the last run.
+
+    A run can stop right after reading the listing when the fingerprint is the
+    same as last time, the same events are inside the announce window, and the
+    last run reached a final outcome for every one of them.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.state = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r') as f:
+                    self.state = json.load(f)
+            except Exception as e:
+                logging.warning(f"Could not read last run state {path}, starting fresh: {str(e)}")
+
+    def is_unchanged(self, group_url, fingerprint, events_in_window):
+        last = self.state.get(group_url)
+        if not last or last.get('fingerprint') != fingerprint:
+            return False
+        window_urls = sorted(event_url for event_url, _ in events_in_window)
+        if window_urls != last.get('events_in_window'):
+            return False
+        outcomes = last.get('outcomes', {})
+        return all(outcomes.get(event_url) in FINAL_OUTCOMES for event_url in window_urls)
+
+    def save_run(self, group_url, fingerprint, events_in_window, outcomes):
+        self.state[group_url] = {
+            'fingerprint': fingerprint,
+            'events_in_window': sorted(event_url for event_url, _ in events_in_window),
+            'outcomes': outcomes,
+            'finished_at': datetime.now().isoformat()
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.state, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+def percentile(values, fraction):
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+class PerformanceHistory:
+    """Per-phase durations of recent runs, to catch Meetup or the host getting slower.
+
+    Each run is stored as the mean duration of every phase it went through
+    (driver start, auth, listing, and the per-event navigate/banner/click
+    steps). Only the last max_runs runs are kept. A phase regresses when this
+    run's mean is more than factor times its p50 over the earlier runs.
+    """
+
+    # Earlier runs needed before a phase is judged, and the smallest slowdown worth reporting
+    MIN_BASELINE_RUNS = 5
+    MIN_REGRESSION_SECONDS = 1.0
+
+    def __init__(self, path, max_runs=100):
+        self.path = path
+        self.max_runs = max_runs
+        self.runs = []
+        if os.path.exists(path):
+            try:
+                with open(path, 'r') as f:
+                    self.runs = json.load(f)
+            except Exception as e:
+                logging.warning(f"Could not read performance history {path}, starting fresh: {str(e)}")
+
+    def baseline(self, name, runs=None):
+        """All recorded per-run means of a phase."""
+        runs = self.runs if runs is None else runs
+        return [run['phases'][name] for run in runs if name in run['phases']]
+
+    def phase_names(self):
+        names = []
+        for run in self.runs:
+            names.extend(name for name in run['phases'] if name not in names)
+        return names
+
+    def find_regressions(self, phases, factor):
+        regressions = []
+        for name, seconds in phases.items():
+            baseline = self.baseline(name)
+            if len(baseline) < self.MIN_BASELINE_RUNS:
+                continue
+            p50 = percentile(baseline, 0.5)
+            if seconds > factor * p50 and seconds - p50 >= self.MIN_REGRESSION_SECONDS:
+                regressions.append((name, seconds, p50, percentile(baseline, 0.95), len(baseline)))
+        return regressions
+
+    def record_run(self, timings, factor):
+        """Add this run to the history and return the phases that regressed against the earlier runs."""
+        phases = {name: round(sum(durations) / len(durations), 3)
+                  for name, durations in timings.durations.items() if durations}
+        regressions = self.find_regressions(phases, factor)
+        self.runs.append({
+            'finished_at': datetime.now().isoformat(timespec='seconds'),
+            'total': round(timings.total(), 3),
+            'phases': phases
+        })
+        self.runs = self.runs[-self.max_runs:]
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.runs, f)
+        os.replace(tmp_path, self.path)
+        return regressions
+
+    def trend_table(self, recent=5):
+        """Rows of phase, runs, p50, p95, p50 of the last few runs, last run and the recent/overall ratio."""
+        header = f"{'phase':<22}{'runs':>6}{'p50':>9}{'p95':>9}{f'last{recent} p50':>12}{'last':>9}{'trend':>8}"
+        lines = [header, '-' * len(header)]
+        for name in self.phase_names():
+            values = self.baseline(name)
+            recent_values = self.baseline(name, self.runs[-recent:]) or values
+            p50 = percentile(values, 0.5)
+            recent_p50 = percentile(recent_values, 0.5)
+            trend = f"{recent_p50 / p50:.2f}x" if p50 else '-'
+            lines.append(f"{name:<22}{len(values):>6}{p50:>8.2f}s{percentile(values, 0.95):>8.2f}s"
+                         f"{recent_p50:>11.2f}s{values[-1]:>8.2f}s{trend:>8}")
+        return '\n'.join(lines)
+
+def report_performance(history, timings, factor):
+    """Record the run in the performance history and email one summary if any phase regressed."""
+    try:
+        regressions = history.record_run(timings, factor)
+    except Exception as e:
+        logging.warning(f"Could not update performance history: {str(e)}")
+        return
+    if not regressions:
+        return
+
+    lines = [f"{name}: {seconds:.2f}s this run vs p50 {p50:.2f}s / p95 {p95:.2f}s over the last {runs} runs "
+             f"({seconds / p50:.1f}x)" for name, seconds, p50, p95, runs in regressions]
+    logging.warning("PERFORMANCE REGRESSION:\n" + "\n".join(lines))
+    send_error_email(
+        f"PERFORMANCE REGRESSION: {len(regressions)} phases took more than {factor}x their usual time:\n\n"
+        + "\n".join(lines) + "\n\n" + history.trend_table(),
+        run_file('meetup_announcer.log'),
+        None
+    )
+
+class EventSchedule:
+    """Remembers each event's start time so runs only do work when something is due.
+
+    For every group we keep the events from the last listing with their start
+    time, the time they become eligible (start minus the announce window) and
+    the outcome of the last visit. A scheduled run is due when the listing needs
+    a refresh or when a known event has crossed into the window without having
+    been visited yet; otherwise it exits without starting a browser.
+    """
+
+    # Longest wait between attempts while runs keep failing before the listing, e.g. logged out
+    MAX_RETRY = timedelta(hours=6)
+
+    def __init__(self, path, listing_refresh_hours=24):
+        self.path = path
+        self.listing_refresh = timedelta(hours=listing_refresh_hours)
+        self.state = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r') as f:
+                    self.state = json.load(f)
+            except Exception as e:
+                logging.warning(f"Could not read schedule file {path}, starting fresh: {str(e)}")
+
+    def save(self):
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(self.state, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.path)
+
+    def group(self, group_url):
+        return self.state.setdefault(group_url, {'last_listing': None, 'events': {}})
+
+    @staticmethod
+    def now():
+        return datetime.now(pytz.UTC)
+
+    def listing_due(self, group_url):
+        last_listing = self.group(group_url)['last_listing']
+        if not last_listing:
+            return True
+        return self.now() >= date_parser.isoparse(last_listing) + self.listing_refresh
+
+    def record_listing(self, group_url, event_urls):
+        """Store the events from a fresh listing, keeping outcomes of events we already know."""
+        group = self.group(group_url)
+        known_events = group['events']
+        events = {}
+        for event_url, event_date in event_urls:
+            entry = known_events.get(event_url, {})
+            entry['date'] = event_date
+            try:
+                start = parse_event_date(event_date)
+                if not start.tzinfo:
+                    start = pytz.UTC.localize(start)
+                entry['start'] = start.isoformat()
+                # is_event_within_range accepts anything under ANNOUNCE_WINDOW_DAYS + 1 whole days away
+                entry['eligible_at'] = (start - timedelta(days=ANNOUNCE_WINDOW_DAYS + 1)).isoformat()
+            except Exception as e:
+                logging.warning(f"Could not parse date {event_date} for schedule: {str(e)}")
+                entry['start'] = None
+                entry['eligible_at'] = None
+            events[event_url] = entry
+        group['events'] = events
+        group['last_listing'] = self.now().isoformat()
+        self.save()
+
+    def is_eligible(self, entry):
+        # Events we couldn't date are treated as eligible, like is_event_within_range does
+        return not entry.get('eligible_at') or date_parser.isoparse(entry['eligible_at']) <= self.now()
+
+    def events_to_visit(self, group_url, event_urls):
+        """Filter a fresh listing down to eligible events that don't have a final outcome yet."""
+        events = self.group(group_url)['events']
+        to_visit = []
+        for event_url, event_date in event_urls:
+            entry = events.get(event_url, {})
+            if entry.get('outcome') in FINAL_OUTCOMES:
+                continue
+            if self.is_eligible(entry):
+                to_visit.append((event_url, event_date))
+        logging.info(f"Schedule: {len(to_visit)} of {len(event_urls)} listed events need a visit")
+        return to_visit
+
+    def due_events(self, group_url):
+        """Eligible events that have never been visited, in start order.
+
+        Events whose last visit failed wait for the next listing refresh rather
+        than being retried on every wake-up.
+        """
+        events = self.group(group_url)['events']
+        due = [(entry.get('start') or '', event_url, entry['date'])
+               for event_url, entry in events.items()
+               if 'outcome' not in entry and self.is_eligible(entry)]
+        return [(event_url, event_date) for _, event_url, event_date in sorted(due)]
+
+    def record_outcome(self, group_url, event_url, outcome):
+        entry = self.group(group_url)['events'].setdefault(event_url, {'date': None, 'start': None, 'eligible_at': None})
+        entry['outcome'] = outcome
+        entry['visited_at'] = self.now().isoformat()
+        self.save()
+
+    def record_failed_attempt(self, group_url):
+        """Back off after a run that couldn't get to the events: an hour, then doubling up to MAX_RETRY."""
+        group = self.group(group_url)
+        group['failed_attempts'] = group.get('failed_attempts', 0) + 1
+        retry_delay = min(self.MAX_RETRY, timedelta(hours=2 ** (group['failed_attempts'] - 1)))
+        group['retry_at'] = (self.now() + retry_delay).isoformat()
+        logging.info(f"Schedule: {group['failed_attempts']} failed attempts in a row for {group_url} - "
+                     f"not trying again before {group['retry_at']}")
+        self.save()
+
+    def clear_failed_attempts(self, group_url):
+        group = self.group(group_url)
+        if group.pop('failed_attempts', None) is not None:
+            group.pop('retry_at', None)
+            self.save()
+
+    def next_wake(self, group_url):
+        """When this group next needs a run: the listing refresh or the next event becoming eligible.
+
+        After failed attempts nothing is due before the backoff is over.
+        """
+        group = self.group(group_url)
+        if not group['last_listing']:
+            wake = self.now()
+        else:
+            wake_times = [date_parser.isoparse(group['last_listing']) + self.listing_refresh]
+            for entry in group['events'].values():
+                if 'outcome' not in entry:
+                    wake_times.append(date_parser.isoparse(entry['eligible_at']) if entry.get('eligible_at') else self.now())
+            wake = min(wake_times)
+        if group.get('retry_at'):
+            wake = max(wake, date_parser.isoparse(group['retry_at']))
+        return wake
+
+    def is_due(self, group_url):
+        return self.next_wake(group_url) <= self.now()
+
+class WorkQueue:
+    """Lease-based work table shared by announcer workers.
+
+    Each group is a row per cycle (one cycle per day by default). A worker claims
+    a group by taking a lease that expires after lease_seconds; the lease is
+    renewed while the worker makes progress and marked done when it finishes.
+    If a worker crashes its lease simply expires and another worker picks the
+    group up, so a group is only ever held by one worker at a time.
+
+    The database can live on a shared filesystem to coordinate workers across
+    hosts, as long as that filesystem supports SQLite's file locking.
+    """
+
+    def __init__(self, db_path, cycle, lease_seconds=900):
+        self.db_path = db_path
+        self.cycle = cycle
+        self.lease_seconds = lease_seconds
+        self.conn = sqlite3.connect(db_path, timeout=30, isolation_level=None)
+        self.conn.execute('PRAGMA busy_timeout = 30000')
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS group_leases (
+                cycle TEXT NOT NULL,
+                group_url TEXT NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                owner TEXT,
+                lease_expires REAL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                finished_at REAL,
+                PRIMARY KEY (cycle, group_url)
+            )
+        """)
+
+    def enqueue(self, group_urls):
+        """Add groups to this cycle's work table. Groups already present are left alone."""
+        self.conn.executemany(
+            'INSERT OR IGNORE INTO group_leases (cycle, group_url) VALUES (?, ?)',
+            [(self.cycle, group_url) for group_url in group_urls]
+        )
+
+    def claim(self, owner):
+        """Claim the next pending (or abandoned) group. Returns its URL, or None if there's no work left."""
+        now = time.time()
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            row = self.conn.execute(
+                """SELECT group_url FROM group_leases
+                   WHERE cycle = ? AND (status = 'pending' OR (status = 'claimed' AND lease_expires < ?))
+                   ORDER BY attempts, group_url LIMIT 1""",
+                (self.cycle, now)
+            ).fetchone()
+            if row is None:
+                self.conn.execute('COMMIT')
+                return None
+            self.conn.execute(
+                """UPDATE group_leases
+                   SET status = 'claimed', owner = ?, lease_expires = ?, attempts = attempts + 1
+                   WHERE cycle = ? AND group_url = ?""",
+                (owner, now + self.lease_seconds, self.cycle, row[0])
+            )
+            self.conn.execute('COMMIT')
+        except Exception:
+            self.conn.execute('ROLLBACK')
+            raise
+        logging.info(f"Worker {owner} claimed {row[0]}")
+        return row[0]
+
+    def renew(self, group_url, owner):
+        """Extend our lease on a group. Returns False if the lease was lost to another worker."""
+        cursor = self.conn.execute(
+            """UPDATE group_leases SET lease_expires = ?
+               WHERE cycle = ? AND group_url = ? AND owner = ? AND status = 'claimed'""",
+            (time.time() + self.lease_seconds, self.cycle, group_url, owner)
+        )
+        return cursor.rowcount == 1
+
+    def complete(self, group_url, owner, status='done'):
+        """Mark a claimed group as finished ('done' or 'failed') for this cycle."""
+        self.conn.execute(
+            """UPDATE group_leases SET status = ?, lease_expires = NULL, finished_at = ?
+               WHERE cycle = ? AND group_url = ? AND owner = ?""",
+            (status, time.time(), self.cycle, group_url, owner)
+        )
+
+    def release(self, group_url, owner):
+        """Give a claimed group back so another worker can take it."""
+        self.conn.execute(
+            """UPDATE group_leases SET status = 'pending', owner = NULL, lease_expires = NULL
+               WHERE cycle = ? AND group_url = ? AND owner = ? AND status = 'claimed'""",
+            (self.cycle, group_url, owner)
+        )
+
+    def close(self):
+        self.conn.close()
+
+class LeaseLost(Exception):
+    """Raised when another worker has taken over the group this worker was announcing."""
+
+class WorkLease:
+    """A worker's lease on the group it is announcing.
+
+    renew() is called from sd_watchdog_ping, so the lease stays alive through
+    authentication, the listing and slow event pages, not just between events.
+    check() is called right before anything is announced and raises LeaseLost
+    if another worker has claimed the group in the meantime.
+    """
+
+    def __init__(self, queue, group_url, owner):
+        self.queue = queue
+        self.group_url = group_url
+        self.owner = owner
+        self.renewed_at = time.monotonic()
+        self.lost = False
+
+    def renew(self, force=False):
+        """Extend the lease, at most every tenth of its length unless forced. Returns False if it is gone."""
+        if self.lost:
+            return False
+        if not force and time.monotonic() - self.renewed_at < self.queue.lease_seconds / 10:
+            return True
+        try:
+            held = self.queue.renew(self.group_url, self.owner)
+        except sqlite3.Error as e:
+            logging.warning(f"Could not renew the lease on {self.group_url}: {str(e)}")
+            # Only a forced renewal has to prove we still hold the group
+            return not force
+        if not held:
+            self.lost = True
+            logging.error(f"Lost lease on {self.group_url} - another worker took it over")
+            return False
+        self.renewed_at = time.monotonic()
+        return True
+
+    def check(self):
+        if not self.renew(force=True):
+            raise LeaseLost(f"Lost lease on {self.group_url} - another worker took it over")
+
+def check_work_lease():
+    """Make sure a --worker still holds its group right before announcing an event."""
+    if work_lease:
+        work_lease.check()
+
+def run_worker(args):
+    """Claim groups from the work table and announce them until none are left."""
+    global work_lease
+    worker_name = args.worker_name
+    queue = WorkQueue(args.work_db, args.cycle, args.lease_seconds)
+    queue.enqueue(args.group_url)
+
+    current_group = None
+    display = None
+    driver = None
+    watchdog = None
+
+    def handle_termination(signum, frame):
+        # Hand the group back right away instead of waiting for the lease to expire
+        if current_group:
+            queue.release(current_group, worker_name)
+            logging.info(f"Worker {worker_name} released {current_group} on signal {signum}")
+        sys.exit(1)
+
+    signal.signal(signal.SIGTERM, handle_termination)
+
+    try:
+        while True:
+            current_group = queue.claim(worker_name)
+            if current_group is None:
+                logging.info(f"Worker {worker_name}: no more groups to claim for cycle {args.cycle}")
+                break
+
+            # Only start the browser once there is actually work to do
+            if driver is None:
+                display = setup_display()
+                debugging_port = allocate_debugging_port()
+                profile_path = prepare_worker_profile(worker_name)
+                logging.info(f"Worker {worker_name} using debugging port {debugging_port}")
+                driver_factory = lambda: setup_driver(debugging_port=debugging_port, profile_path=profile_path,
+                                                      low_memory=args.low_memory)
+                driver = driver_factory()
+                watchdog = MemoryWatchdog(driver, driver_factory, args.rss_limit_mb)
+
+            group_url = current_group
+            work_lease = WorkLease(queue, group_url, worker_name)
+
+            try:
+                announce_events(driver, group_url, args.announce_backend, args.announce_endpoint,
+                                heartbeat=work_lease.check, watchdog=watchdog)
+                driver = watchdog.driver
+                queue.complete(group_url, worker_name, 'done')
+            except LeaseLost as e:
+                # The group is someone else's now - leave its row to them
+                logging.warning(f"Worker {worker_name} stopped on {group_url}: {e}")
+                driver = watchdog.driver
+            except DeadlineExceeded as e:
+                # Hand the group back for another worker or run, and stop claiming - there's no time left
+                logging.warning(f"{str(e)} - skipping {group_url}")
+                queue.release(group_url, worker_name)
+                current_group = None
+                work_lease = None
+                report_skipped_groups([(group_url, str(e))])
+                break
+            except Exception as e:
+                full_traceback = traceback.format_exc()
+                error_message = f"Worker {worker_name} failed on {group_url}: {e}\nStacktrace:\n{full_traceback}"
+                logging.error(error_message)
+                queue.complete(group_url, worker_name, 'failed')
+                driver = watchdog.driver
+                send_error_email(error_message, run_file('meetup_announcer.log'), run_file('error_screenshot.png'))
+            work_lease = None
+            current_group = None
+    finally:
+        work_lease = None
+        if current_group:
+            queue.release(current_group, worker_name)
+        queue.close()
+        if driver:
+            driver.quit()
+        if display:
+            display.stop()
+
+def run_worker_pool(args):
+    """Start args.workers local worker processes and wait for them to finish."""
+    command = [sys.executable, os.path.abspath(__file__), '--worker',
+               '--work-db', args.work_db, '--cycle', args.cycle,
+               '--lease-seconds', str(args.lease_seconds),
+               '--announce-backend', args.announce_backend,
+               '--announce-endpoint', args.announce_endpoint,
+               '--governor-db', args.governor_db or args.work_db,
+               '--default-rate', str(args.default_rate), '--default-burst', str(args.default_burst)]
+    for host, (rate, burst) in args.rate_limit:
+        command += ['--rate-limit', f"{host}={rate}:{burst}"]
+    if args.low_memory:
+        command.append('--low-memory')
+    if args.rss_limit_mb:
+        command += ['--rss-limit-mb', str(args.rss_limit_mb)]
+    if args.deadline:
+        command += ['--deadline', str(args.deadline)]
+    command += ['--network-capture-size', str(args.network_capture_size),
+                '--slow-event-seconds', str(args.slow_event_seconds)]
+    for group_url in args.group_url:
+        command += ['--group-url', group_url]
+
+    # Enqueue once up front so workers start claiming immediately
+    queue = WorkQueue(args.work_db, args.cycle, args.lease_seconds)
+    queue.enqueue(args.group_url)
+    queue.close()
+
+    logging.info(f"Starting {args.workers} worker processes for {len(args.group_url)} groups")
+    # Numbered names keep each worker's log file and profile copy the same from run to run
+    processes = [subprocess.Popen(command + ['--worker-name', f"{socket.gethostname()}-{index + 1}"])
+                 for index in range(args.workers)]
+    exit_codes = [process.wait() for process in processes]
+    logging.info(f"Workers finished with exit codes: {exit_codes}")
+
+def poll_listing(driver, listing_url, timeout=30):
+    """Reload the events listing in the current tab and read its cards with one script per check."""
+    # Nobody reads the listing's network events; don't let them pile up between announces
+    drain_performance_log(driver)
+    governed_get(driver, listing_url)
+    give_up_at = time.monotonic() + timeout
+    while True:
+        try:
+            records = driver.execute_script(LISTING_RECORDS_SCRIPT, EVENT_CARD_SELECTORS)
+        except Exception as e:
+            logging.warning(f"Could not read events listing: {str(e)}")
+            records = None
+        if records or time.monotonic() >= give_up_at:
+            break
+        time.sleep(0.5)
+    if not records:
+        return None
+    return [record for record in records if record.get('url') and record.get('date')]
+
+# Longest a repeatedly failing event waits between retries in --watch mode
+WATCH_MAX_RETRY_SECONDS = 6 * 3600
+
+def watch_retry_delay(interval, failure_count):
+    """Seconds to wait after the failure_count-th failure in a row: one interval, doubling up to the cap."""
+    return min(WATCH_MAX_RETRY_SECONDS, interval * 2 ** (failure_count - 1))
+
+def watch_groups(driver, group_urls, interval, announce_backend='ui', announce_endpoint=ANNOUNCE_API_URL, watchdog=None):
+    """Poll each group's events listing and announce new eligible events as soon as they show up.
+
+    Each group's listing stays open in its own tab, which is reloaded every
+    interval seconds. Events are announced in the original tab. An event is
+    only visited until it reaches a final outcome, so steady-state polls cost
+    one listing load per group. An event that fails is retried with
+    exponential backoff, and only its first failure is emailed. A group whose
+    login or organizer check fails is kept and re-checked with the same
+    backoff, with one email per outage. Runs until interrupted.
+    """
+    http_session = create_http_session() if announce_backend == 'http' else None
+    handled = {group_url: set() for group_url in group_urls}
+    # event key -> (failures in a row, monotonic time of the next retry)
+    failures = {}
+    # group url -> (failed login checks in a row, monotonic time of the next check)
+    verify_failures = {}
+    verified = set()
+    listing_tabs = {}
+    work_tab = driver.current_window_handle
+    driver_restarts = 0
+
+    while True:
+        for group_url in group_urls:
+            if watchdog:
+                driver.switch_to.window(work_tab)
+                driver = watchdog.check(driver)
+                if watchdog.driver_restarts != driver_restarts:
+                    # Fresh browser - all our tabs are gone
+                    driver_restarts = watchdog.driver_restarts
+                    listing_tabs = {}
+                # Recycling replaces the work tab and leaves the listing tabs alone
+                work_tab = driver.current_window_handle
+
+            if group_url not in verified:
+                if group_url in verify_failures and time.monotonic() < verify_failures[group_url][1]:
+                    continue
+                driver.switch_to.window(work_tab)
+                sd_watchdog_ping(f"Watching {group_url}: checking login")
+                if not check_authentication(driver, group_url) or not check_organizer_permissions(driver, group_url):
+                    # Could be a lost login or a page that didn't load - keep the group and check again later
+                    failure_count = verify_failures.get(group_url, (0, 0))[0] + 1
+                    retry_delay = watch_retry_delay(interval, failure_count)
+                    verify_failures[group_url] = (failure_count, time.monotonic() + retry_delay)
+                    logging.warning(f"Login check for {group_url} failed {failure_count} times in a row - "
+                                    f"checking again in {retry_delay:.0f}s")
+                    if failure_count == 1:
+                        try:
+                            driver.save_screenshot(run_file('watch_error_screenshot.png'))
+                        except Exception:
+                            logging.error("Could not save watch error screenshot")
+                        send_error_email(
+                            f"WATCH MODE: Paused watching {group_url} because the logged-in user is not authenticated "
+                            f"or is not an organizer of the group. The login is checked again with increasing delays "
+                            f"(up to {WATCH_MAX_RETRY_SECONDS // 3600} hours) and watching resumes on its own once it "
+                            f"passes. If the login is gone, please run the script with --manual-login.",
+                            run_file('meetup_announcer.log'),
+                            run_file('watch_error_screenshot.png')
+                        )
+                    continue
+                if group_url in verify_failures:
+                    logging.info(f"Login check for {group_url} passed again - resuming watching")
+                    del verify_failures[group_url]
+                verified.add(group_url)
+
+            if group_url not in listing_tabs:
+                driver.switch_to.new_window('tab')
+                listing_tabs[group_url] = driver.current_window_handle
+            driver.switch_to.window(listing_tabs[group_url])
+
+            sd_watchdog_ping(f"Watching {group_url}: polling events listing")
+            records = poll_listing(driver, f"{group_url}events/")
+            if records is None:
+                logging.warning(f"No event cards found on {group_url}events/ - re-checking login on the next poll")
+                verified.discard(group_url)
+                continue
+
+            new_events = []
+            for record in records:
+                event_url = canonical_event_url(record['url'])
+                if not event_url:
+                    continue
+                event_key = extract_event_id(event_url)
+                # Cancellation is decided on the event page - card text can mention "cancelled" for other reasons
+                if event_key in handled[group_url]:
+                    continue
+                if event_key in failures and time.monotonic() < failures[event_key][1]:
+                    continue
+                if any(event_key == new_event[0] for new_event in new_events):
+                    continue
+                if is_event_within_range(record['date']):
+                    new_events.append((event_key, event_url, record['date']))
+
+            if not new_events:
+                logging.info(f"Watching {group_url}: no new eligible events")
+                continue
+
+            logging.info(f"Watching {group_url}: {len(new_events)} new eligible events")
+            driver.switch_to.window(work_tab)
+            failed_events = []
+            if network_recorder:
+                network_recorder.dumped.clear()
+            for event_key, event_url, event_date in new_events:
+                sd_watchdog_ping(f"Watching {group_url}: announcing event on {event_date}")
+                try:
+                    outcome = process_event(driver, event_url, event_date, http_session, announce_endpoint)
+                    reason = last_failure_reason or outcome
+                except Exception as e:
+                    logging.error(f"Error processing event on {event_date}: {str(e)}\n{traceback.format_exc()}")
+                    outcome = 'error'
+                    reason = str(e)
+                if outcome in FINAL_OUTCOMES:
+                    handled[group_url].add(event_key)
+                    failures.pop(event_key, None)
+                    continue
+
+                failure_count = failures.get(event_key, (0, 0))[0] + 1
+                retry_delay = watch_retry_delay(interval, failure_count)
+                failures[event_key] = (failure_count, time.monotonic() + retry_delay)
+                logging.warning(f"Event on {event_date} failed ({outcome}) {failure_count} times in a row - "
+                                f"retrying in {retry_delay:.0f}s")
+                if failure_count == 1:
+                    failed_events.append(f"{event_date}: {reason}")
+
+            if failed_events:
+                try:
+                    driver.save_screenshot(run_file('error_screenshot.png'))
+                except Exception:
+                    logging.error("Could not save error screenshot")
+                send_error_email(
+                    f"ANNOUNCE FAILURES (watch mode): Failed to announce {len(failed_events)} events on {group_url}; "
+                    f"they will be retried with increasing delays (up to {WATCH_MAX_RETRY_SECONDS // 3600} hours) "
+                    f"and further failures are only logged:\n\n" + "\n".join(failed_events),
+                    run_file('meetup_announcer.log'),
+                    run_file('error_screenshot.png'),
+                    network_recorder.dumped if network_recorder else None
+                )
+
+        # Sleep until the next poll, keeping systemd's watchdog fed
+        next_poll = time.monotonic() + interval
+        while time.monotonic() < next_poll:
+            sd_watchdog_ping(f"Watching {len(group_urls)} groups - next poll in {next_poll - time.monotonic():.0f}s")
+            time.sleep(min(10, max(0, next_poll - time.monotonic())))
+
+def run_replay(args):
+    """Re-run announce_events offline against a recorded archive and report timings."""
+    global email_notifications_enabled, network_confirmation_enabled, request_governor
+    email_notifications_enabled = False
+    network_confirmation_enabled = False
+    # The replay server is local - don't slow it down with Meetup's rate limits
+    request_governor = RequestGovernor(default_rate=1000, default_burst=1000)
+
+    server = ReplayServer(PageArchive(args.replay))
+    server.start()
+    timings = RunTimings()
+    display = None
+    driver = None
+    try:
+        display = setup_display()
+        with timings.phase('driver_start'):
+            driver = setup_driver(low_memory=args.low_memory)
+        for group_url in args.group_url:
+            # Always announce through the (inert) replayed UI so nothing reaches Meetup
+            announce_events(driver, server.rewrite_url(group_url), 'ui', timings=timings)
+    finally:
+        if driver:
+            driver.quit()
+        if display:
+            display.stop()
+        server.stop()
+
+class AnnouncerError(Exception):
+    """Raised by AnnouncerSession when it can't do what was asked, e.g. the browser isn't logged in."""
+
+# Outcome of one event: outcome is one of process_event's results, or 'error'
+EventResult = namedtuple('EventResult', ['url', 'date', 'outcome', 'seconds'])
+GroupResult = namedtuple('GroupResult', ['group_url', 'events', 'duplicate_links', 'non_event_links'])
+
+class AnnouncerSession:
+    """Announce from inside another Python process instead of running the script.
+
+    The session owns the virtual display, the Chrome driver and the verified
+    login, so any number of calls share one browser. Results are returned
+    instead of emailed, and logging is left to the caller's configuration.
+
+        with AnnouncerSession() as session:
+            result = session.announce_group('https://www.meetup.com/joyful-parenting-sf/')
+            for event in result.events:
+                print(event.date, event.outcome)
+    """
+
+    def __init__(self, announce_backend='ui', announce_endpoint=ANNOUNCE_API_URL,
+                 profile_path=DEFAULT_PROFILE_PATH, low_memory=False, rss_limit_mb=None):
+        self.announce_backend = announce_backend
+        self.announce_endpoint = announce_endpoint
+        self.profile_path = profile_path
+        self.low_memory = low_memory
+        self.rss_limit_mb = 600 if low_memory and rss_limit_mb is None else rss_limit_mb
+        self.display = None
+        self.watchdog = None
+        self.http_session = None
+        self.verified_groups = set()
+
+    @property
+    def driver(self):
+        # The watchdog may have restarted the driver
+        return self.watchdog.driver if self.watchdog else None
+
+    def start(self):
+        """Start the display and browser. Called automatically by the first method that needs them."""
+        if self.watchdog:
+            return self
+        self.display = setup_display()
+        driver_factory = lambda: setup_driver(profile_path=self.profile_path, low_memory=self.low_memory)
+        self.watchdog = MemoryWatchdog(driver_factory(), driver_factory, self.rss_limit_mb)
+        if self.announce_backend == 'http':
+            self.http_session = create_http_session()
+        return self
+
+    def close(self):
+        if self.http_session:
+            self.http_session.close()
+            self.http_session = None
+        if self.watchdog:
+            try:
+                self.watchdog.driver.quit()
+            except Exception as e:
+                logging.warning(f"Could not quit the driver: {str(e)}")
+            self.watchdog = None
+        if self.display:
+            self.display.stop()
+            self.display = None
+        self.verified_groups.clear()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, exc_traceback):
+        self.close()
+
+    def verify_login(self, group_url):
+        """Make sure the browser is logged in as an organizer of the group. Checked once per group.
+
+        The session uses the login saved in the Chrome profile by --manual-login.
+        """
+        if group_url in self.verified_groups:
+            return
+        self.start()
+        if not check_authentication(self.driver, group_url):
+            raise AnnouncerError("Not logged in to Meetup - run meetup_announcer.py --manual-login")
+        if not check_organizer_permissions(self.driver, group_url):
+            raise AnnouncerError(f"Logged in, but not an organizer of {group_url}")
+        self.verified_groups.add(group_url)
+
+    def read_listing(self, group_url):
+        """Return (event urls and dates, duplicate links, non-event links) for the group's listed events.
+
+        Cancelled events are left in; announce_event finds them cancelled on the event page.
+        """
+        if not group_url.endswith('/'):
+            group_url += '/'
+        self.verify_login(group_url)
+        event_cards = find_event_cards(self.driver, group_url)
+        if not event_cards:
+            raise AnnouncerError(f"No event cards found on {group_url}events/")
+        records = read_event_cards(self.driver, event_cards)
+        return index_event_urls((record['url'], record['date']) for record in records)
+
+    def list_eligible_events(self, group_url):
+        """The group's events inside the announce window as (url, date) pairs, soonest first."""
+        event_urls, _, _ = self.read_listing(group_url)
+        return sorted((event for event in event_urls if is_event_within_range(event[1])), key=event_start_sort_key)
+
+    def announce_event(self, event_url, event_date=None):
+        """Announce one event if it still needs announcing, and return an EventResult."""
+        canonical_url = canonical_event_url(event_url)
+        if not canonical_url:
+            raise AnnouncerError(f"{event_url} is not a link to an event")
+        self.verify_login(canonical_url.split('/events/')[0] + '/')
+
+        driver = self.watchdog.check(self.driver)
+        started = time.monotonic()
+        try:
+            # Per-event timings only; a long-lived session keeps no history that could grow
+            outcome = process_event(driver, canonical_url, event_date or canonical_url, self.http_session,
+                                    self.announce_endpoint)
+        except Exception as e:
+            logging.error(f"Error processing event {canonical_url}: {str(e)}\n{traceback.format_exc()}")
+            outcome = 'error'
+        return EventResult(canonical_url, event_date, outcome, round(time.monotonic() - started, 2))
+
+    def announce_group(self, group_url):
+        """Announce every eligible event of a group, soonest first, and return a GroupResult."""
+        event_urls, duplicate_links, non_event_links = self.read_listing(group_url)
+        eligible = sorted((event for event in event_urls if is_event_within_range(event[1])), key=event_start_sort_key)
+        results = [self.announce_event(event_url, event_date) for event_url, event_date in eligible]
+        return GroupResult(group_url, results, duplicate_links, non_event_links)
+
 def main():
+    configure_logging()
     parser = argparse.ArgumentParser(description='Meetup Event Announcer')
     parser.add_argument('--manual-login', action='store_true', help='Perform manual login')
     parser.add_argument('--auto-login', action='store_true', help='Attempt automated login using saved credentials')
-    parser.add_argument('--group-url', required=True, help='URL of your Meetup group')
+    parser.add_argument('--group-url', action='append',
+                        help='URL of your Meetup group (repeat to process several groups); '
+                             'required except with --perf-report and --check-session')
+    parser.add_argument('--announce-backend', choices=['ui', 'http'], default='ui',
+                        help='Announce by clicking through the UI, or by calling the API directly (falls back to the UI)')
+    parser.add_argument('--announce-endpoint', default=ANNOUNCE_API_URL,
+                        help='API endpoint for the http announce backend (e.g. a local announce_stub_server.py)')
+    parser.add_argument('--worker', action='store_true',
+                        help='Run as a worker that claims groups from the shared work table')
+    parser.add_argument('--workers', type=int, default=0,
+                        help='Start this many local worker processes and wait for them')
+    parser.add_argument('--worker-name',
+                        help='Name of this worker in the work table and in its log and screenshot file names '
+                             '(default: host name and process id)')
+    parser.add_argument('--work-db', default=os.path.join(BASE_DIR, 'work_leases.db'),
+                        help='SQLite work table shared by workers (put it on shared storage for multiple hosts)')
+    parser.add_argument('--cycle', default=datetime.now().strftime('%Y-%m-%d'),
+                        help='Work cycle name; each group is announced once per cycle (default: today)')
+    parser.add_argument('--lease-seconds', type=int, default=900,
+                        help='How long a worker holds a group without progress before others may take it')
+    parser.add_argument('--scheduled', action='store_true',
+                        help='Only run when an event has entered the announce window or the listing refresh is due')
+    parser.add_argument('--schedule-file', default=os.path.join(BASE_DIR, 'schedule_state.json'),
+                        help='Where --scheduled keeps event start times and outcomes')
+    parser.add_argument('--listing-refresh-hours', type=float, default=24,
+                        help='How often --scheduled reloads the events listing to find new events')
+    parser.add_argument('--low-memory', action='store_true',
+                        help='Run Chromium with fewer processes and capped caches/JS heap (implies --rss-limit-mb 600)')
+    parser.add_argument('--rss-limit-mb', type=int, default=None,
+                        help='Recycle the tab, then restart the driver, between events when browser RSS exceeds this')
+    parser.add_argument('--record', metavar='ARCHIVE',
+                        help='Save the group page, events list and event pages visited in this run to a zip archive')
+    parser.add_argument('--replay', metavar='ARCHIVE',
+                        help='Re-run offline against a recorded archive served locally, and report timings')
+    parser.add_argument('--rate-limit', type=parse_rate_limit, action='append', default=[], metavar='HOST=RATE[:BURST]',
+                        help='Requests per second (and burst) allowed to a host, e.g. www.meetup.com=0.5:3')
+    parser.add_argument('--default-rate', type=float, default=1.0,
+                        help='Requests per second allowed to hosts without a --rate-limit')
+    parser.add_argument('--default-burst', type=int, default=5,
+                        help='Burst allowed to hosts without a --rate-limit')
+    parser.add_argument('--governor-db',
+                        help='SQLite file holding the rate limiter state, shared by every process using it '
+                             '(workers default to the work table)')
+    parser.add_argument('--last-run-file', default=os.path.join(BASE_DIR, 'last_run_state.json'),
+                        help='Where the events listing fingerprint and last outcomes are kept')
+    parser.add_argument('--force', action='store_true',
+                        help='Visit event pages even if the events listing is unchanged since the last run')
+    parser.add_argument('--deadline', type=float, metavar='SECONDS',
+                        help='Give up on remaining work after this many seconds; the budget is split across '
+                             'authentication, listing and events, and skipped events are reported')
+    parser.add_argument('--watch', action='store_true',
+                        help='Keep running and announce newly created events within minutes instead of once a day')
+    parser.add_argument('--watch-interval', type=float, default=300,
+                        help='Seconds between events listing polls in --watch mode')
+    parser.add_argument('--network-capture-size', type=int, default=1000,
+                        help='How many CDP Network/Page events to keep per event page for failure reports (0 turns capture off)')
+    parser.add_argument('--slow-event-seconds', type=float, default=30,
+                        help='Also save the network capture for event pages that take longer than this')
+    parser.add_argument('--perf-history-file', default=os.path.join(BASE_DIR, 'performance_history.json'),
+                        help='Where per-phase durations of recent runs are kept')
+    parser.add_argument('--perf-regression-factor', type=float, default=2.0,
+                        help='Email a summary when a phase takes more than this many times its usual (p50) duration')
+    parser.add_argument('--perf-report', action='store_true',
+                        help='Print the per-phase trend table from the performance history and exit')
+    parser.add_argument('--check-session', action='store_true',
+                        help='Check the saved login from the Chrome profile\'s cookies without starting a browser, then exit')
+    parser.add_argument('--check-session-http', action='store_true',
+                        help='With --check-session (and before --scheduled runs), confirm the cookies with one request '
+                             'to Meetup (needs the cryptography package)')
+    parser.add_argument('--session-warn-days', type=float, default=3,
+                        help='Warn by email when the saved login expires within this many days')
     args = parser.parse_args()
+    if not args.group_url and not (args.perf_report or args.check_session):
+        parser.error('the following arguments are required: --group-url')
+
+    if args.perf_report:
+        history = PerformanceHistory(args.perf_history_file)
+        if not history.runs:
+            print(f"No runs recorded in {args.perf_history_file} yet")
+        else:
+            print(f"{len(history.runs)} runs from {history.runs[0]['finished_at']} to {history.runs[-1]['finished_at']}")
+            print(history.trend_table())
+        return
+
+    global request_governor, page_recorder, run_deadline, network_recorder, run_file_suffix
+    governor_db = args.governor_db or (args.work_db if args.worker else ':memory:')
+    request_governor = RequestGovernor(governor_db, args.default_rate, args.default_burst, dict(args.rate_limit))
+
+    if args.check_session:
+        status = check_session(DEFAULT_PROFILE_PATH, args.check_session_http)
+        sys.exit(0 if report_session(status, args.session_warn_days) else 1)
+
+    if args.deadline and args.watch:
+        logging.warning("--deadline does not apply to --watch mode, which runs until stopped - ignoring it")
+    elif args.deadline:
+        run_deadline = RunDeadline(args.deadline)
+
+    if args.network_capture_size > 0:
+        network_recorder = NetworkRecorder(args.network_capture_size, args.slow_event_seconds)
+
+    # Under systemd (Type=notify) this starts the watchdog clock
+    sd_notify('READY=1', 'STATUS=Starting')
+
+    if args.low_memory and args.rss_limit_mb is None:
+        args.rss_limit_mb = 600
+
+    if args.worker:
+        args.worker_name = args.worker_name or f"{socket.gethostname()}-{os.getpid()}"
+        run_file_suffix = re.sub(r'[^A-Za-z0-9_.-]', '_', args.worker_name)
+
+    # Scheduled runs wait until they know something is due
+    if not args.scheduled or args.replay or args.workers or args.worker:
+        start_log_file()
+
+    if args.replay:
+        run_replay(args)
+        return
+    if args.workers:
+        cleanup_previous_screenshots()
+        run_worker_pool(args)
+        return
+    if args.worker:
+        run_worker(args)
+        return
     
+    schedule = None
+    if args.scheduled:
+        schedule = EventSchedule(args.schedule_file, args.listing_refresh_hours)
+        due_groups = [group_url for group_url in args.group_url if schedule.is_due(group_url)]
+        if not due_groups and not args.manual_login:
+            next_wake = min(schedule.next_wake(group_url) for group_url in args.group_url)
+            logging.info(f"Nothing due - next event becomes eligible or listing refresh is due at {next_wake.isoformat()}")
+            return
+        start_log_file()
+        args.group_url = due_groups or args.group_url
+
+        # A logged-out profile can't announce anything - find out before starting the browser
+        if not args.manual_login and not report_session(check_session(DEFAULT_PROFILE_PATH, args.check_session_http),
+                                                        args.session_warn_days):
+            for group_url in args.group_url:
+                schedule.record_failed_attempt(group_url)
+            return
+
+    if args.record:
+        page_recorder = PageRecorder(args.record)
+
     display = None
     driver = None
+    watchdog = None
+    timings = RunTimings()
+    last_run = None if args.force else LastRunState(args.last_run_file)
     
     try:
         # Clean up screenshots from previous runs
         cleanup_previous_screenshots()
         
         display = setup_display(args.manual_login)
-        driver = setup_driver(args.manual_login)  # Pass manual_login parameter
+        driver_factory = lambda: setup_driver(args.manual_login, low_memory=args.low_memory)
+        with timings.phase('driver_start'):
+            driver = driver_factory()  # Pass manual_login parameter
+        watchdog = MemoryWatchdog(driver, driver_factory, args.rss_limit_mb)
         
         if args.manual_login:
-            if not manual_login(driver, args.group_url):
+            if not manual_login(driver, args.group_url[0]):
                 return
         elif args.auto_login:
-            if not automated_login(driver, args.group_url):
+            if not automated_login(driver, args.group_url[0]):
                 logging.error("Automated login failed. You may need to run with --manual-login instead.")
                 return
         
-        announce_events(driver, args.group_url)
+        if args.watch:
+            watch_groups(driver, args.group_url, args.watch_interval, args.announce_backend, args.announce_endpoint,
+                         watchdog=watchdog)
+            return
+
+        skipped_groups = []
+        for group_url in args.group_url:
+            if run_deadline and run_deadline.expired():
+                skipped_groups.append((group_url, 'the run deadline was reached before the group was started'))
+                continue
+            try:
+                announce_events(driver, group_url, args.announce_backend, args.announce_endpoint, schedule=schedule,
+                                watchdog=watchdog, timings=timings, last_run=last_run)
+            except DeadlineExceeded as e:
+                logging.warning(f"{str(e)} - skipping {group_url}")
+                skipped_groups.append((group_url, str(e)))
+            driver = watchdog.driver
+        report_skipped_groups(skipped_groups)
+
+        report_performance(PerformanceHistory(args.perf_history_file), timings, args.perf_regression_factor)
         
     except Exception as e:
         # Get full traceback for debugging
@@ -1129,14 +3770,19 @@ def main():
         # Send error notification email
         send_error_email(
             error_message,
-            'meetup_announcer.log',
-            'error_screenshot.png'
+            run_file('meetup_announcer.log'),
+            run_file('error_screenshot.png')
         )
     finally:
+        if watchdog:
+            driver = watchdog.driver
         if driver:
             driver.quit()
         if display:
             display.stop()
+        if page_recorder:
+            page_recorder.save()
+        sd_notify('STOPPING=1')
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
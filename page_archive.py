@@ -0,0 +1,127 @@
+"""Record Meetup pages during a real run and serve them back for offline replays.
+
+The archive is a zip file holding one HTML snapshot per page (the group page,
+the events list and each event page) plus an index.json that maps the page's
+path to its snapshot. Snapshots are the rendered DOM as the announcer saw it,
+so they replay without needing Meetup's JavaScript bundles.
+
+During replay the pages are served from a local HTTP server. Links back to
+www.meetup.com are rewritten to the server, and a Content-Security-Policy
+blocks scripts and every external request, so a replayed run only ever sees
+the archived pages.
+"""
+import json
+import logging
+import threading
+import zipfile
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+
+MEETUP_ORIGIN = 'https://www.meetup.com'
+INDEX_NAME = 'index.json'
+
+# Scripts off, nothing leaves the local server
+REPLAY_CSP = "default-src 'self'; script-src 'none'; style-src 'self' 'unsafe-inline'; img-src 'self' data:"
+
+def archive_key(url):
+    """Key an archived page by its path, ignoring host, query string and fragment."""
+    path = urlsplit(url).path or '/'
+    if not path.endswith('/'):
+        path += '/'
+    return path
+
+class PageRecorder:
+    """Collects page snapshots during a run and writes them to a zip archive."""
+
+    def __init__(self, archive_path):
+        self.archive_path = archive_path
+        self.pages = {}
+
+    def record(self, url, html):
+        key = archive_key(url)
+        self.pages[key] = {
+            'url': url,
+            'recorded_at': datetime.now().isoformat(),
+            'html': html
+        }
+        logging.info(f"Recorded {url} ({len(html)} bytes)")
+
+    def save(self):
+        index = {}
+        with zipfile.ZipFile(self.archive_path, 'w', compression=zipfile.ZIP_DEFLATED) as archive:
+            for number, (key, page) in enumerate(sorted(self.pages.items())):
+                member = f"pages/{number:04d}.html"
+                archive.writestr(member, page['html'])
+                index[key] = {'url': page['url'], 'recorded_at': page['recorded_at'], 'file': member}
+            archive.writestr(INDEX_NAME, json.dumps(index, indent=2))
+        logging.info(f"Saved {len(index)} recorded pages to {self.archive_path}")
+
+class PageArchive:
+    """Read-only view of a recorded archive."""
+
+    def __init__(self, archive_path):
+        self.archive_path = archive_path
+        with zipfile.ZipFile(archive_path, 'r') as archive:
+            index = json.loads(archive.read(INDEX_NAME))
+            self.pages = {key: archive.read(entry['file']).decode('utf-8') for key, entry in index.items()}
+        self.index = index
+
+    def get(self, url):
+        return self.pages.get(archive_key(url))
+
+class ReplayServer:
+    """Serves a PageArchive on a local port in a background thread."""
+
+    def __init__(self, archive, host='127.0.0.1', port=0):
+        self.archive = archive
+        handler = self.make_handler()
+        self.server = ThreadingHTTPServer((host, port), handler)
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def rewrite_url(self, url):
+        """Point a www.meetup.com URL at the replay server."""
+        if url.startswith(MEETUP_ORIGIN):
+            return self.base_url + url[len(MEETUP_ORIGIN):]
+        return url
+
+    def make_handler(self):
+        replay = self
+
+        class ReplayHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                html = replay.archive.get(self.path)
+                if html is None:
+                    self.send_error(404, 'Page not in archive')
+                    return
+                body = html.replace(MEETUP_ORIGIN, replay.base_url).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/html; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('Content-Security-Policy', REPLAY_CSP)
+                self.send_header('Cache-Control', 'no-store')
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                # Never let a replayed run announce anything
+                self.send_error(403, 'Replay is read-only')
+
+            def log_message(self, format, *args):
+                logging.debug(format % args)
+
+        return ReplayHandler
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self.thread.start()
+        logging.info(f"Replaying {len(self.archive.pages)} archived pages from {self.archive.archive_path} at {self.base_url}")
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
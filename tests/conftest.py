@@ -0,0 +1,35 @@
+import os
+import sys
+import time
+
+import pytest
+
+# The announcer is a script in the repository root, not an installed package
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+class FakeClock:
+    """Stands in for time.time/time.monotonic/time.sleep; sleeping just moves the clock."""
+
+    def __init__(self, start=1_000_000.0):
+        self.now = start
+        self.slept = 0.0
+
+    def time(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.now += seconds
+        self.slept += seconds
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    fake = FakeClock()
+    monkeypatch.setattr(time, 'time', fake.time)
+    monkeypatch.setattr(time, 'monotonic', fake.time)
+    monkeypatch.setattr(time, 'sleep', fake.sleep)
+    return fake
@@ -0,0 +1,98 @@
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+
+from meetup_announcer import EventSchedule
+
+GROUP = 'https://www.meetup.com/joyful-parenting-sf/'
+SOON = ('https://www.meetup.com/joyful-parenting-sf/events/1/', 'Sat, Oct 10, 2026 · 10:00 AM PDT')
+LATER = ('https://www.meetup.com/joyful-parenting-sf/events/2/', 'Sun, Oct 25, 2026 · 10:00 AM PDT')
+
+
+@pytest.fixture
+def now(monkeypatch):
+    current = {'now': datetime(2026, 10, 1, 12, 0, tzinfo=pytz.UTC)}
+    monkeypatch.setattr(EventSchedule, 'now', staticmethod(lambda: current['now']))
+    return current
+
+
+def make_schedule(tmp_path, listing_refresh_hours=24):
+    return EventSchedule(str(tmp_path / 'schedule_state.json'), listing_refresh_hours=listing_refresh_hours)
+
+
+def test_new_group_is_due(tmp_path, now):
+    schedule = make_schedule(tmp_path)
+    assert schedule.listing_due(GROUP)
+    assert schedule.is_due(GROUP)
+
+
+def test_only_eligible_events_are_visited(tmp_path, now):
+    schedule = make_schedule(tmp_path)
+    schedule.record_listing(GROUP, [SOON, LATER])
+
+    assert schedule.events_to_visit(GROUP, [SOON, LATER]) == [SOON]
+
+
+def test_nothing_due_until_the_next_event_enters_the_window(tmp_path, now):
+    schedule = make_schedule(tmp_path, listing_refresh_hours=24 * 30)
+    schedule.record_listing(GROUP, [SOON, LATER])
+    schedule.record_outcome(GROUP, SOON[0], 'announced')
+
+    # LATER becomes eligible ANNOUNCE_WINDOW_DAYS + 1 days before it starts
+    assert not schedule.is_due(GROUP)
+    assert schedule.next_wake(GROUP) == datetime(2026, 10, 6, 17, 0, tzinfo=pytz.UTC)
+
+    now['now'] = schedule.next_wake(GROUP)
+    assert schedule.is_due(GROUP)
+    assert not schedule.listing_due(GROUP)
+    assert schedule.due_events(GROUP) == [LATER]
+
+
+def test_listing_refresh_makes_the_group_due(tmp_path, now):
+    schedule = make_schedule(tmp_path)
+    schedule.record_listing(GROUP, [SOON])
+    schedule.record_outcome(GROUP, SOON[0], 'already_announced')
+    assert not schedule.is_due(GROUP)
+
+    now['now'] += timedelta(hours=24)
+
+    assert schedule.listing_due(GROUP)
+    assert schedule.is_due(GROUP)
+
+
+def test_failed_events_wait_for_the_listing_refresh(tmp_path, now):
+    schedule = make_schedule(tmp_path)
+    schedule.record_listing(GROUP, [SOON])
+    schedule.record_outcome(GROUP, SOON[0], 'failed')
+
+    assert schedule.due_events(GROUP) == []
+    # ... but a fresh listing visits them again
+    assert schedule.events_to_visit(GROUP, [SOON]) == [SOON]
+
+
+def test_state_survives_a_restart(tmp_path, now):
+    schedule = make_schedule(tmp_path, listing_refresh_hours=24 * 30)
+    schedule.record_listing(GROUP, [SOON, LATER])
+    schedule.record_outcome(GROUP, SOON[0], 'announced')
+
+    reloaded = make_schedule(tmp_path, listing_refresh_hours=24 * 30)
+
+    assert reloaded.events_to_visit(GROUP, [SOON, LATER]) == []
+    assert reloaded.next_wake(GROUP) == schedule.next_wake(GROUP)
+
+
+def test_failed_attempts_back_off(tmp_path, now):
+    schedule = make_schedule(tmp_path)
+    start = now['now']
+
+    schedule.record_failed_attempt(GROUP)
+    assert not schedule.is_due(GROUP)
+    assert schedule.next_wake(GROUP) == start + timedelta(hours=1)
+
+    for _ in range(5):
+        schedule.record_failed_attempt(GROUP)
+    assert make_schedule(tmp_path).next_wake(GROUP) == start + EventSchedule.MAX_RETRY
+
+    schedule.clear_failed_attempts(GROUP)
+    assert schedule.is_due(GROUP)
@@ -0,0 +1,64 @@
+import pytest
+
+from meetup_announcer import canonical_event_url, extract_event_id, index_event_urls, listing_fingerprint
+
+EVENT = 'https://www.meetup.com/joyful-parenting-sf/events/305123456/'
+
+
+@pytest.mark.parametrize('url', [
+    EVENT,
+    'https://www.meetup.com/joyful-parenting-sf/events/305123456',
+    'https://www.meetup.com/joyful-parenting-sf/events/305123456/?utm_source=share',
+    'https://www.meetup.com/joyful-parenting-sf/events/305123456/#comments',
+    'https://www.meetup.com/joyful-parenting-sf/events/305123456/attendees/',
+])
+def test_event_links_are_canonicalized(url):
+    assert canonical_event_url(url) == EVENT
+
+
+@pytest.mark.parametrize('url', [
+    'https://www.meetup.com/joyful-parenting-sf/events/',
+    'https://www.meetup.com/joyful-parenting-sf/events/?type=past',
+    'https://www.meetup.com/joyful-parenting-sf/events/past/',
+    'https://www.meetup.com/joyful-parenting-sf/events/calendar/',
+    'https://www.meetup.com/joyful-parenting-sf/',
+    '',
+    None,
+])
+def test_non_event_links_are_rejected(url):
+    assert canonical_event_url(url) is None
+
+
+def test_alphanumeric_ids_and_other_hosts_are_kept():
+    assert canonical_event_url('http://127.0.0.1:8000/group/events/qxbcdtyhcjbkb') == \
+        'http://127.0.0.1:8000/group/events/qxbcdtyhcjbkb/'
+    assert extract_event_id(EVENT + '?x=1') == '305123456'
+
+
+def test_index_keeps_first_link_per_event_and_counts_the_rest():
+    links = [
+        (EVENT + '?utm_source=share', 'Sat, Nov 1'),
+        ('https://www.meetup.com/joyful-parenting-sf/events/', 'Sat, Nov 1'),
+        (EVENT, 'Sat, Nov 1 (duplicate card)'),
+        ('https://www.meetup.com/joyful-parenting-sf/events/305999999/', 'Sun, Nov 2'),
+        (EVENT + '#map', 'Sat, Nov 1'),
+    ]
+
+    events, duplicates, non_events = index_event_urls(links)
+
+    assert events == [
+        (EVENT, 'Sat, Nov 1'),
+        ('https://www.meetup.com/joyful-parenting-sf/events/305999999/', 'Sun, Nov 2'),
+    ]
+    assert duplicates == 2
+    assert non_events == 1
+
+
+def test_fingerprint_ignores_card_order_and_link_decoration():
+    first = [{'url': EVENT, 'date': 'Sat', 'status': 'ACTIVE'},
+             {'url': EVENT.replace('305123456', '305999999'), 'date': 'Sun', 'status': 'ACTIVE'}]
+    second = [dict(first[1]), dict(first[0], url=EVENT + '?utm_source=share')]
+    cancelled = [first[0], dict(first[1], status='CANCELLED')]
+
+    assert listing_fingerprint(first) == listing_fingerprint(second)
+    assert listing_fingerprint(first) != listing_fingerprint(cancelled)
@@ -0,0 +1,60 @@
+import pytest
+
+from meetup_announcer import LastRunState
+
+GROUP = 'https://www.meetup.com/joyful-parenting-sf/'
+FIRST = ('https://www.meetup.com/joyful-parenting-sf/events/1/', 'Sat, Oct 10, 2026 · 10:00 AM PDT')
+SECOND = ('https://www.meetup.com/joyful-parenting-sf/events/2/', 'Sun, Oct 11, 2026 · 10:00 AM PDT')
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    return str(tmp_path / 'last_run_state.json')
+
+
+def saved_run(state_path, outcomes, fingerprint='abc', events_in_window=(FIRST, SECOND)):
+    LastRunState(state_path).save_run(GROUP, fingerprint, list(events_in_window), outcomes)
+    return LastRunState(state_path)
+
+
+def test_first_run_has_work(state_path):
+    assert not LastRunState(state_path).is_unchanged(GROUP, 'abc', [FIRST, SECOND])
+
+
+@pytest.mark.parametrize('outcomes', [
+    {FIRST[0]: 'announced', SECOND[0]: 'already_announced'},
+    {FIRST[0]: 'cancelled', SECOND[0]: 'no_banner'},
+])
+def test_final_outcomes_mean_no_work(state_path, outcomes):
+    state = saved_run(state_path, outcomes)
+    assert state.is_unchanged(GROUP, 'abc', [SECOND, FIRST])
+
+
+def test_changed_fingerprint_has_work(state_path):
+    state = saved_run(state_path, {FIRST[0]: 'announced', SECOND[0]: 'announced'})
+    assert not state.is_unchanged(GROUP, 'abd', [FIRST, SECOND])
+
+
+def test_event_entering_the_window_has_work(state_path):
+    state = saved_run(state_path, {FIRST[0]: 'announced'}, events_in_window=[FIRST])
+    assert not state.is_unchanged(GROUP, 'abc', [FIRST, SECOND])
+
+
+@pytest.mark.parametrize('outcome', ['failed', 'error', None])
+def test_unfinished_event_has_work(state_path, outcome):
+    outcomes = {FIRST[0]: 'announced'}
+    if outcome:
+        outcomes[SECOND[0]] = outcome
+    state = saved_run(state_path, outcomes)
+    assert not state.is_unchanged(GROUP, 'abc', [FIRST, SECOND])
+
+
+def test_groups_are_tracked_separately(state_path):
+    state = saved_run(state_path, {FIRST[0]: 'announced', SECOND[0]: 'announced'})
+    assert not state.is_unchanged('https://www.meetup.com/another-group/', 'abc', [FIRST, SECOND])
+
+
+def test_unreadable_state_starts_fresh(state_path):
+    with open(state_path, 'w') as f:
+        f.write('{not json')
+    assert LastRunState(state_path).state == {}
@@ -0,0 +1,105 @@
+import pytest
+
+import meetup_announcer
+from meetup_announcer import DeadlineExceeded, RequestGovernor, RunDeadline, parse_rate_limit
+
+URL = 'https://www.meetup.com/joyful-parenting-sf/events/'
+
+
+def host_state(governor, host='www.meetup.com'):
+    return governor.load(host, meetup_announcer.time.time())
+
+
+def test_burst_then_steady_rate(clock):
+    governor = RequestGovernor(default_rate=2.0, default_burst=3)
+
+    for _ in range(3):
+        governor.acquire(URL)
+    assert clock.slept == 0
+
+    governor.acquire(URL)
+    assert clock.slept == pytest.approx(0.5)
+
+
+def test_hosts_have_separate_buckets(clock):
+    governor = RequestGovernor(default_rate=1.0, default_burst=1)
+    governor.acquire(URL)
+    governor.acquire('https://secure.meetup.com/login/')
+    assert clock.slept == 0
+
+
+def test_per_host_limits_cover_subdomains():
+    governor = RequestGovernor(host_limits=dict([parse_rate_limit('meetup.com=0.5:3')]))
+    assert governor.limits('www.meetup.com') == (0.5, 3)
+    assert governor.limits('example.com') == (1.0, 5)
+
+
+def test_throttle_halves_rate_and_backs_off_exponentially(clock):
+    governor = RequestGovernor()
+    governor.acquire(URL)
+
+    governor.report(URL, throttled=True)
+    _, _, rate_factor, cooldown_until, consecutive = host_state(governor)
+    assert rate_factor == 0.5
+    assert cooldown_until - clock.now == pytest.approx(30)
+    assert consecutive == 1
+
+    governor.report(URL, throttled=True)
+    _, _, rate_factor, cooldown_until, consecutive = host_state(governor)
+    assert rate_factor == 0.25
+    assert cooldown_until - clock.now == pytest.approx(60)
+    assert consecutive == 2
+
+
+def test_cooldown_is_capped_and_retry_after_wins(clock):
+    governor = RequestGovernor()
+    for _ in range(10):
+        governor.report(URL, throttled=True)
+    _, _, _, cooldown_until, _ = host_state(governor)
+    assert cooldown_until - clock.now == pytest.approx(600)
+
+    other = 'https://api.meetup.com/gql'
+    governor.report(other, throttled=True, retry_after=7)
+    _, _, _, cooldown_until, _ = host_state(governor, 'api.meetup.com')
+    assert cooldown_until - clock.now == pytest.approx(7)
+
+
+def test_acquire_waits_out_the_cooldown(clock):
+    governor = RequestGovernor()
+    governor.report(URL, throttled=True)
+
+    governor.acquire(URL)
+
+    assert clock.slept == pytest.approx(30)
+
+
+def test_clean_responses_recover_the_rate(clock):
+    governor = RequestGovernor()
+    governor.report(URL, throttled=True)
+    for _ in range(5):
+        governor.report(URL, throttled=False)
+
+    _, _, rate_factor, _, consecutive = host_state(governor)
+    assert rate_factor == pytest.approx(0.75)
+    assert consecutive == 0
+
+
+def test_cooldown_past_the_deadline_raises_without_waiting(clock, monkeypatch):
+    governor = RequestGovernor()
+    governor.report(URL, throttled=True)
+    monkeypatch.setattr(meetup_announcer, 'run_deadline', RunDeadline(2))
+
+    with pytest.raises(DeadlineExceeded):
+        governor.acquire(URL)
+    assert clock.slept == 0
+
+
+def test_governor_state_is_shared_through_the_database(tmp_path, clock):
+    db_path = str(tmp_path / 'governor.db')
+    first = RequestGovernor(db_path, default_rate=1.0, default_burst=1)
+    second = RequestGovernor(db_path, default_rate=1.0, default_burst=1)
+
+    first.acquire(URL)
+    second.acquire(URL)
+
+    assert clock.slept == pytest.approx(1.0)
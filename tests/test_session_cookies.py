@@ -0,0 +1,110 @@
+import hashlib
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+import pytz
+
+from meetup_announcer import CHROME_EPOCH, check_session, decrypt_cookie_value, read_profile_cookies
+
+
+def chrome_time(when):
+    return int((when - CHROME_EPOCH) / timedelta(microseconds=1))
+
+
+def encrypt_v10(value, host, db_version):
+    pytest.importorskip('cryptography')
+    from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+    plain = value.encode('utf-8')
+    if db_version >= 24:
+        plain = hashlib.sha256(host.encode('utf-8')).digest() + plain
+    padding = 16 - len(plain) % 16
+    plain += bytes([padding]) * padding
+    key = hashlib.pbkdf2_hmac('sha1', b'peanuts', b'saltysalt', 1, 16)
+    encryptor = Cipher(algorithms.AES(key), modes.CBC(b' ' * 16)).encryptor()
+    return b'v10' + encryptor.update(plain) + encryptor.finalize()
+
+
+def make_profile(tmp_path, cookies, db_version=24):
+    """Write a minimal Chrome cookie database; cookies are (name, host, expires, value, encrypted_value)."""
+    network_dir = tmp_path / 'Default' / 'Network'
+    network_dir.mkdir(parents=True)
+    conn = sqlite3.connect(str(network_dir / 'Cookies'))
+    conn.execute("CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)")
+    conn.execute("INSERT INTO meta VALUES ('version', ?)", (str(db_version),))
+    conn.execute("CREATE TABLE cookies (name TEXT, host_key TEXT, expires_utc INTEGER, value TEXT, encrypted_value BLOB)")
+    for name, host, expires, value, encrypted_value in cookies:
+        conn.execute("INSERT INTO cookies VALUES (?, ?, ?, ?, ?)",
+                     (name, host, chrome_time(expires) if expires else 0, value, encrypted_value))
+    conn.commit()
+    conn.close()
+    return str(tmp_path)
+
+
+def in_days(days):
+    return datetime.now(pytz.UTC) + timedelta(days=days)
+
+
+def test_reads_only_the_site_cookies(tmp_path):
+    expires = datetime(2027, 1, 1, tzinfo=pytz.UTC)
+    profile = make_profile(tmp_path, [
+        ('MEETUP_MEMBER', '.meetup.com', expires, 'member', b''),
+        ('other', '.example.com', expires, 'x', b''),
+        ('session_only', 'www.meetup.com', None, 'y', b''),
+    ])
+
+    cookies, db_version = read_profile_cookies(profile)
+
+    assert db_version == 24
+    assert [(cookie['name'], cookie['expires']) for cookie in cookies] == [
+        ('MEETUP_MEMBER', expires), ('session_only', None)]
+
+
+@pytest.mark.parametrize('db_version', [23, 24])
+def test_decrypts_basic_store_cookies(db_version):
+    cookie = {'value': '', 'encrypted_value': encrypt_v10('id=42&token', '.meetup.com', db_version)}
+    assert decrypt_cookie_value(cookie, db_version) == 'id=42&token'
+
+
+def test_plain_and_keyring_cookies():
+    assert decrypt_cookie_value({'value': 'plain', 'encrypted_value': b''}, 24) == 'plain'
+    assert decrypt_cookie_value({'value': '', 'encrypted_value': b'v11' + b'\0' * 16}, 24) is None
+
+
+def test_logged_in_until_the_first_cookie_expires(tmp_path):
+    profile = make_profile(tmp_path, [
+        ('MEETUP_MEMBER', '.meetup.com', in_days(30), '', b'x'),
+        ('MEETUP_SESSION', '.meetup.com', in_days(2), '', b'x'),
+    ])
+
+    status = check_session(profile)
+
+    assert status.logged_in and not status.confirmed and status.problem is None
+    assert status.expires == read_profile_cookies(profile)[0][1]['expires']
+
+
+def test_missing_cookie_is_logged_out(tmp_path):
+    profile = make_profile(tmp_path, [('MEETUP_MEMBER', '.meetup.com', in_days(30), '', b'x')])
+
+    status = check_session(profile)
+
+    assert not status.logged_in
+    assert 'MEETUP_SESSION' in status.problem
+
+
+def test_expired_cookie_is_logged_out(tmp_path):
+    profile = make_profile(tmp_path, [
+        ('MEETUP_MEMBER', '.meetup.com', in_days(30), '', b'x'),
+        ('MEETUP_SESSION', '.meetup.com', in_days(-1), '', b'x'),
+    ])
+
+    status = check_session(profile)
+
+    assert not status.logged_in
+    assert status.problem == 'Session cookies expired: MEETUP_SESSION'
+
+
+def test_missing_profile(tmp_path):
+    status = check_session(str(tmp_path / 'nowhere'))
+    assert not status.logged_in
+    assert status.problem.startswith('Could not read the cookie database')
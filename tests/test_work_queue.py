@@ -0,0 +1,108 @@
+import pytest
+
+import meetup_announcer
+from meetup_announcer import LeaseLost, WorkLease, WorkQueue, sd_watchdog_ping
+
+GROUP_A = 'https://www.meetup.com/group-a/'
+GROUP_B = 'https://www.meetup.com/group-b/'
+
+
+def make_queue(tmp_path, lease_seconds=60):
+    return WorkQueue(str(tmp_path / 'work_leases.db'), '2026-10-18', lease_seconds)
+
+
+def test_each_group_is_claimed_once(tmp_path, clock):
+    queue = make_queue(tmp_path)
+    queue.enqueue([GROUP_A, GROUP_B])
+    queue.enqueue([GROUP_A])  # enqueueing again doesn't duplicate work
+
+    claimed = {queue.claim('worker-1'), queue.claim('worker-2')}
+
+    assert claimed == {GROUP_A, GROUP_B}
+    assert queue.claim('worker-3') is None
+
+
+def test_expired_lease_is_reclaimed(tmp_path, clock):
+    queue = make_queue(tmp_path, lease_seconds=60)
+    queue.enqueue([GROUP_A])
+    assert queue.claim('crashed-worker') == GROUP_A
+
+    clock.advance(30)
+    assert queue.claim('worker-2') is None
+
+    clock.advance(31)
+    assert queue.claim('worker-2') == GROUP_A
+    # The crashed worker lost its lease and can't renew or complete it any more
+    assert not queue.renew(GROUP_A, 'crashed-worker')
+    queue.complete(GROUP_A, 'crashed-worker')
+    assert queue.renew(GROUP_A, 'worker-2')
+
+
+def test_renewed_lease_is_not_reclaimed(tmp_path, clock):
+    queue = make_queue(tmp_path, lease_seconds=60)
+    queue.enqueue([GROUP_A])
+    queue.claim('worker-1')
+
+    clock.advance(50)
+    assert queue.renew(GROUP_A, 'worker-1')
+    clock.advance(50)
+
+    assert queue.claim('worker-2') is None
+
+
+def test_completed_group_is_not_claimed_again(tmp_path, clock):
+    queue = make_queue(tmp_path)
+    queue.enqueue([GROUP_A])
+    queue.claim('worker-1')
+    queue.complete(GROUP_A, 'worker-1')
+
+    clock.advance(3600)
+
+    assert queue.claim('worker-2') is None
+
+
+def test_released_group_goes_back_to_pending(tmp_path, clock):
+    queue = make_queue(tmp_path)
+    queue.enqueue([GROUP_A])
+    queue.claim('worker-1')
+    queue.release(GROUP_A, 'worker-1')
+
+    assert queue.claim('worker-2') == GROUP_A
+
+
+def test_workers_share_the_table_through_the_file(tmp_path, clock):
+    first = make_queue(tmp_path)
+    second = make_queue(tmp_path)
+    first.enqueue([GROUP_A])
+
+    assert first.claim('worker-1') == GROUP_A
+    assert second.claim('worker-2') is None
+
+
+def test_progress_pings_keep_the_lease(tmp_path, clock, monkeypatch):
+    queue = make_queue(tmp_path, lease_seconds=60)
+    queue.enqueue([GROUP_A])
+    queue.claim('worker-1')
+    monkeypatch.setattr(meetup_announcer, 'work_lease', WorkLease(queue, GROUP_A, 'worker-1'))
+
+    # One slow event page, pinging the watchdog as it goes
+    for _ in range(20):
+        clock.advance(10)
+        sd_watchdog_ping()
+
+    assert queue.claim('worker-2') is None
+    meetup_announcer.work_lease.check()
+
+
+def test_lost_lease_stops_the_announce(tmp_path, clock):
+    queue = make_queue(tmp_path, lease_seconds=60)
+    queue.enqueue([GROUP_A])
+    queue.claim('worker-1')
+    lease = WorkLease(queue, GROUP_A, 'worker-1')
+
+    clock.advance(61)
+    assert queue.claim('worker-2') == GROUP_A
+
+    assert not lease.renew()
+    with pytest.raises(LeaseLost):
+        lease.check()